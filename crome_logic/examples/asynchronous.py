@@ -0,0 +1,17 @@
+import asyncio
+
+from crome_logic.specification.temporal import LTL
+
+
+async def asynchronous_example() -> None:
+    specs = [LTL(f"G(a{i} -> F(b{i})) & F(a{i})") for i in range(20)]
+    specs.append(LTL("G(a) & F(!a)"))
+    results = await asyncio.gather(
+        *[spec.check_satisfiability_async() for spec in specs]
+    )
+    for spec, sat in zip(specs, results):
+        print(f"{spec}:\t{sat}")
+
+
+if __name__ == "__main__":
+    asyncio.run(asynchronous_example())
@@ -0,0 +1,29 @@
+from crome_logic.specification.boolean import Bool
+from crome_logic.specification.boolean.bdd import BoolBDD
+from crome_logic.specification.temporal import LTL
+
+
+def bdd_example() -> None:
+    tautology = Bool("(a -> b) | (b -> c)")
+    print(f"{tautology} is valid: {tautology.is_valid}")
+
+    f = BoolBDD.from_bool(Bool("a & (b | c)"))
+    g = BoolBDD.from_bool(Bool("(a & b) | (c & a)"))
+    print(f"{f} == {g}: {f == g}")
+
+    conjunction = BoolBDD.conjunction(
+        BoolBDD.from_bool(Bool(f"x{i} | y{i}")) for i in range(50)
+    )
+    print(f"conjunction of 50 clauses, satisfiable: {conjunction.is_satisfiable}")
+    """Each clause has 3 models over its own two atoms"""
+    print(f"models over the 100 atoms: {conjunction.satisfy_count} (3^50)")
+
+    """Boolean abstraction of LTL specifications, the temporal subformulas
+    are atoms"""
+    goals = [LTL(f"G(F(r{i})) | (a{i} & F(b{i}))") for i in range(20)]
+    abstraction = BoolBDD.conjunction(goal.boolean_bdd for goal in goals)
+    print(f"abstraction of 20 goals, satisfiable: {abstraction.is_satisfiable}")
+
+
+if __name__ == "__main__":
+    bdd_example()
@@ -7,6 +7,7 @@ def boolean_example() -> None:
     print(boolean.tree)
     print(boolean.cnf.to_str)
     print(boolean.dnf.to_str)
+    print(boolean.minimize(timeout=1))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+import time
+from copy import deepcopy
+
+import spot
+from pyeda.boolalg.expr import expr
+
+from crome_logic.specification.boolean.tools import dot_to_spot_string
+from crome_logic.specification.temporal import LTL
+from crome_logic.specification.temporal.tools import transform_spot_tree
+from crome_logic.specification.trees import (
+    boolean_tree_to_formula,
+    gen_atoms_tree,
+    gen_ltl_tree,
+)
+from crome_logic.tools.atomic_propositions import extract_ap
+from crome_logic.tools.string_manipulation import pyeda_syntax_fix
+from crome_logic.typelement.basic import Boolean
+from crome_logic.typeset import Typeset
+
+
+def _legacy_deepcopy(spec: LTL) -> None:
+    """What deepcopy used to do, step by step with the same functions:
+    copy the typeset, re-parse the formula, rebuild the trees and rebuild
+    the boolean abstraction (pyeda parse, then the Graphviz DOT round trip
+    of Bool.formula to extract its atoms)."""
+    deepcopy(spec.typeset)
+    expression = transform_spot_tree(spot.formula(spec.init_formula))
+    atom_tree = gen_atoms_tree(spot_f=expression)
+    bool_expression = expr(pyeda_syntax_fix(boolean_tree_to_formula(atom_tree)))
+    bool_formula = dot_to_spot_string(bool_expression.to_dot())
+    Typeset({Boolean(name=ap) for ap in extract_ap(bool_formula)})
+    gen_ltl_tree(spot_f=expression)
+
+
+def copy_benchmark(n_atoms: int = 1000, repetitions: int = 10) -> None:
+    """Time of a deepcopy of a specification with 'n_atoms' atoms."""
+    spec = LTL.conjunction(LTL(f"G(a{i} -> F(b{i}))") for i in range(n_atoms // 2))
+    assert isinstance(spec.typeset, Typeset)
+    print(f"specification with {spec.typeset.size} atoms")
+
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        _legacy_deepcopy(spec)
+    before = (time.perf_counter() - start) / repetitions
+
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        copy = deepcopy(spec)
+    after = (time.perf_counter() - start) / repetitions
+    assert copy is spec
+
+    print(f"deepcopy before:\t{before * 1000:.3f} ms")
+    print(f"deepcopy after:\t\t{after * 1000:.6f} ms")
+
+
+if __name__ == "__main__":
+    copy_benchmark()
@@ -0,0 +1,22 @@
+from crome_logic.specification.temporal import LTL
+from crome_logic.specification.temporal.lattice import build_refinement_lattice
+
+
+def lattice_example() -> None:
+    specs = [
+        LTL("G(a) & G(b)"),
+        LTL("G(a)"),
+        LTL("F(a)"),
+        LTL("G(F(a))"),
+        LTL("G(a & b)"),
+        LTL("G(a) & F(!a)"),
+    ]
+    lattice = build_refinement_lattice(specs)
+    print(lattice)
+    print(f"equivalent:\t{lattice.equivalent}")
+    print(f"unsatisfiable:\t{lattice.unsatisfiable}")
+    print(f"checked: {lattice.n_checked}, inferred: {lattice.n_inferred}")
+
+
+if __name__ == "__main__":
+    lattice_example()
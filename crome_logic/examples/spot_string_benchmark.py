@@ -0,0 +1,45 @@
+import time
+
+from pyeda.boolalg.expr import And, Or, exprvar
+
+from crome_logic.specification.boolean.tools import (
+    dot_to_spot_string,
+    expression_to_spot_string,
+)
+
+
+def _expression(n_literals: int):
+    """Disjunction of conjunctions of 10 literals, half of them negated."""
+    clauses = []
+    for i in range(0, n_literals, 10):
+        literals = []
+        for j in range(i, min(i + 10, n_literals)):
+            x = exprvar("x", j)
+            literals.append(~x if j % 2 else x)
+        clauses.append(And(*literals, simplify=False))
+    return Or(*clauses, simplify=False)
+
+
+def spot_string_benchmark(sizes: tuple[int, ...] = (10, 100, 1000)) -> None:
+    """Time of the conversion of pyeda expressions to spot strings, via
+    Graphviz and with the direct walker."""
+    for n_literals in sizes:
+        expression = _expression(n_literals)
+
+        start = time.perf_counter()
+        dot_to_spot_string(expression.to_dot())
+        dot_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expression_to_spot_string(expression)
+        walker_time = time.perf_counter() - start
+
+        print(
+            f"{n_literals} literals:\t"
+            f"graphviz {dot_time * 1000:.3f} ms\t"
+            f"walker {walker_time * 1000:.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    spot_string_benchmark()
@@ -0,0 +1,41 @@
+import time
+
+from pyeda.boolalg.expr import And, Or, exprvar
+
+from crome_logic.specification.boolean.truth_table import equivalent, truth_table
+
+
+def _expression(n_atoms: int):
+    """Conjunction of (x_i | ~x_i+1) for consecutive atoms."""
+    x = [exprvar("x", i) for i in range(n_atoms)]
+    return And(*[Or(x[i], ~x[(i + 1) % n_atoms]) for i in range(n_atoms)])
+
+
+def truth_table_benchmark(sizes: tuple[int, ...] = (4, 8, 12, 16, 20)) -> None:
+    """Time of satisfiability with satisfy_one and of the truth table
+    (satisfiability, validity, model count)."""
+    for n_atoms in sizes:
+        expression = _expression(n_atoms)
+
+        start = time.perf_counter()
+        expression.satisfy_one()
+        satisfy_one_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table = truth_table(expression)
+        satisfiable, valid = table.is_satisfiable, table.is_valid
+        models = table.model_count
+        table_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert equivalent(expression, expression.to_nnf())
+        equivalent_time = time.perf_counter() - start
+
+        print(f"{n_atoms} atoms: {models} models, sat {satisfiable}, valid {valid}")
+        print(f"\tsatisfy_one:\t{satisfy_one_time * 1e6:.1f} us")
+        print(f"\ttruth table:\t{table_time * 1e6:.1f} us")
+        print(f"\tequivalence:\t{equivalent_time * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    truth_table_benchmark()
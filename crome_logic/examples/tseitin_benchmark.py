@@ -0,0 +1,51 @@
+import time
+
+from pyeda.boolalg.expr import And, AndOp, Or, OrOp, exprvar
+
+from crome_logic.specification.boolean.tseitin import is_satisfiable, tseitin_cnf
+
+
+def _dnf_expression(n_clauses: int):
+    """(x0 & y0) | (x1 & y1) | ... : to_cnf() produces 2^n_clauses clauses."""
+    return Or(*[And(exprvar("x", i), exprvar("y", i)) for i in range(n_clauses)])
+
+
+def _size(cnf) -> tuple[int, int]:
+    """Number of clauses and of literals."""
+    if cnf.is_zero() or cnf.is_one():
+        return 0, 0
+    clauses = cnf.xs if isinstance(cnf, AndOp) else (cnf,)
+    n_literals = sum(len(c.xs) if isinstance(c, OrOp) else 1 for c in clauses)
+    return len(clauses), n_literals
+
+
+def tseitin_benchmark(sizes: tuple[int, ...] = (4, 8, 12, 14)) -> None:
+    """Size and time of the equivalent CNF (to_cnf) and of the Tseitin
+    CNF, and time of a satisfiability check on the Tseitin CNF."""
+    for n_clauses in sizes:
+        expression = _dnf_expression(n_clauses)
+
+        start = time.perf_counter()
+        cnf = expression.to_cnf()
+        to_cnf_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tseitin = tseitin_cnf(expression)
+        tseitin_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert is_satisfiable(expression)
+        sat_time = time.perf_counter() - start
+
+        print(f"{n_clauses} conjunctions")
+        print(
+            f"\tto_cnf:\t{_size(cnf)} (clauses, literals)\t{to_cnf_time * 1000:.3f} ms"
+        )
+        print(
+            f"\ttseitin:\t{_size(tseitin)} (clauses, literals)\t{tseitin_time * 1000:.3f} ms"
+        )
+        print(f"\tsatisfiability on tseitin:\t{sat_time * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    tseitin_benchmark()
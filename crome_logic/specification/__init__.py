@@ -2,12 +2,19 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from aenum import Enum, auto, skip
 
 from crome_logic.specification.string_logic import and_, or_
 from crome_logic.typeset import Typeset
 
+if TYPE_CHECKING:
+    import spot
+
+    from crome_logic.patterns import Pattern
+    from crome_logic.tools.verdict import Verdict
+
 
 class Specification(ABC):
     """Base class representing a specification.
@@ -17,7 +24,8 @@ class Specification(ABC):
         typeset (Typeset)
     """
 
-    _init_formula: str
+    """LTL also accepts patterns and already parsed spot formulas"""
+    _init_formula: str | Pattern | spot.formula
     _typeset: Typeset | None = None
 
     @property
@@ -74,12 +82,12 @@ class Specification(ABC):
 
     @property
     @abstractmethod
-    def is_satisfiable(self: Specification) -> bool:
+    def is_satisfiable(self: Specification) -> bool | Verdict:
         pass
 
     @property
     @abstractmethod
-    def is_valid(self: Specification) -> bool:
+    def is_valid(self: Specification) -> bool | Verdict:
         pass
 
     @property
@@ -1,14 +1,31 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, field
+from typing import Iterable
 
-from pyeda.boolalg.expr import AndOp, Expression, OrOp, expr
-from pyeda.boolalg.minimization import espresso_exprs
+from pyeda.boolalg.bdd import (
+    BDDNODEONE,
+    BDDNODEZERO,
+    BDDNode,
+    BinaryDecisionDiagram,
+    expr2bdd,
+)
+from pyeda.boolalg.expr import And, AndOp, Expression, Or, OrOp, expr
 from treelib import Tree
 
 from crome_logic.specification import Cnf, Dnf, Specification
-from crome_logic.specification.boolean.tools import dot_to_spot_string
+from crome_logic.specification.boolean.minimization import minimize
+from crome_logic.specification.boolean.tools import expression_to_spot_string
+from crome_logic.specification.boolean.truth_table import (
+    MAX_ATOMS,
+    TruthTable,
+    truth_table,
+)
+from crome_logic.specification.boolean.tseitin import (
+    is_satisfiable,
+    is_valid,
+    tseitin_cnf,
+)
 from crome_logic.specification.tools import is_true_string
 from crome_logic.specification.trees import extract_atoms_dictionary, gen_atoms_tree
 from crome_logic.tools.atomic_propositions import extract_ap
@@ -23,15 +40,67 @@ class Bool(Specification):
     _typeset: Typeset | None = None
     _expression: Expression | None = None
     _tree: Tree | None = None
+    _atoms_dictionary: dict[str, str] | None = field(default=None, compare=False)
+    _cnf: Cnf | None = field(default=None, compare=False)
+    _dnf: Dnf | None = field(default=None, compare=False)
+    _bdd: BinaryDecisionDiagram | None = field(default=None, compare=False)
+    _formula: str | None = field(default=None, compare=False)
 
     @property
     def expression(self) -> Expression:
+        """Parsed on first access for unpickled objects."""
+        if self._expression is None:
+            expression = expr(pyeda_syntax_fix(self._init_formula))
+            object.__setattr__(self, "_expression", expression)
         return self._expression
 
     @property
     def tree(self) -> Tree:
+        """Built on first access, '_atoms_dictionary' (if given) provides
+        the LTL formulas of the atoms."""
+        if self._tree is None:
+            tree = gen_atoms_tree(
+                spot_f=self.formula, atoms_dictionary=self._atoms_dictionary
+            )
+            object.__setattr__(self, "_tree", tree)
+            object.__setattr__(
+                self, "_atoms_dictionary", extract_atoms_dictionary(tree)
+            )
         return self._tree
 
+    @property
+    def bdd(self) -> BinaryDecisionDiagram:
+        """Built on first access. pyeda BDDs share a unique table, the
+        BDDs of equivalent expressions have the same root node."""
+        if self._bdd is None:
+            object.__setattr__(self, "_bdd", expr2bdd(self.expression))
+        return self._bdd
+
+    @property
+    def truth_table(self) -> TruthTable:
+        """Built on each access (2^n bits, not kept), only for up to
+        MAX_ATOMS atoms."""
+        return truth_table(self.expression)
+
+    @property
+    def model_count(self) -> int:
+        """Number of models over the atoms of the expression: truth table
+        for few atoms, BDD otherwise."""
+        if self._bdd is None and len(self.expression.support) <= MAX_ATOMS:
+            return self.truth_table.model_count
+        return bdd_model_count(self.bdd, len(self.expression.support))
+
+    def equivalent(self, other: Bool) -> bool:
+        """Truth tables over the common atoms if they are few, BDDs
+        otherwise."""
+        if self._bdd is None or other._bdd is None:
+            variables = self.expression.support | other.expression.support
+            if len(variables) <= MAX_ATOMS:
+                return truth_table(self.expression, variables) == truth_table(
+                    other.expression, variables
+                )
+        return self.bdd.node is other.bdd.node
+
     def __post_init__(self):
         if self._expression is None:
             # print(pyeda_syntax_fix(self._init_formula))
@@ -43,59 +112,96 @@ class Bool(Specification):
             typeset = Typeset(set(map(lambda x: Boolean(name=x), set_ap_str)))
             object.__setattr__(self, "_typeset", typeset)
 
-        if self._tree is None:
-            tree = gen_atoms_tree(self.formula)
-            object.__setattr__(self, "_tree", tree)
-
     @classmethod
     def from_expression(
-        cls, expression: Expression, typeset: Typeset, atoms_dictionary: dict[str, str]
+        cls,
+        expression: Expression,
+        typeset: Typeset,
+        atoms_dictionary: dict[str, str] | None,
     ) -> Bool:
-        formula = dot_to_spot_string(expression.to_dot())
-        tree = gen_atoms_tree(spot_f=formula, atoms_dictionary=atoms_dictionary)
+        formula = expression_to_spot_string(expression)
         return cls(
-            _init_formula=formula, _expression=expression, _typeset=typeset, _tree=tree
+            _init_formula=formula,
+            _expression=expression,
+            _formula=formula,
+            _typeset=typeset,
+            _atoms_dictionary=atoms_dictionary,
+        )
+
+    @classmethod
+    def conjunction(cls, specs: Iterable[Bool]) -> Bool:
+        """Conjunction of all the specifications, built in one pass."""
+        specs = list(specs)
+        return Bool.from_expression(
+            expression=And(*[s.expression for s in specs]),
+            typeset=Typeset.from_typesets(s.typeset for s in specs),
+            atoms_dictionary=_merge_atoms_dictionaries(specs),
+        )
+
+    @classmethod
+    def disjunction(cls, specs: Iterable[Bool]) -> Bool:
+        """Disjunction of all the specifications, built in one pass."""
+        specs = list(specs)
+        return Bool.from_expression(
+            expression=Or(*[s.expression for s in specs]),
+            typeset=Typeset.from_typesets(s.typeset for s in specs),
+            atoms_dictionary=_merge_atoms_dictionaries(specs),
         )
 
     def __hash__(self: Bool):
         return hash(str(self))
 
-    def __deepcopy__(self: Bool, memo):
-        cls = self.__class__
-        result = cls.__new__(cls)
-        for field in fields(cls):
-            if not (field.name == "_expression" or field.name == "_tree"):
-                object.__setattr__(
-                    result, field.name, deepcopy(getattr(self, field.name))
-                )
-        result.__post_init__()  # type: ignore
-        return result
+    def __copy__(self: Bool) -> Bool:
+        return self
+
+    def __deepcopy__(self: Bool, memo) -> Bool:
+        """Bool objects are immutable, copies share them."""
+        return self
 
     @property
     def formula(self) -> str:
-        return dot_to_spot_string(self.expression.to_dot())
+        """Printed from the expression once, str, hash and == use it."""
+        formula = self._formula
+        if formula is None:
+            formula = expression_to_spot_string(self.expression)
+            object.__setattr__(self, "_formula", formula)
+        return formula
 
     def __str__(self):
         return self.formula
 
     @property
     def atoms_dictionary(self) -> dict[str, str]:
-        return extract_atoms_dictionary(self.tree)
-
-    def minimize(self):
-        """Espresso minimization works only for DNF forms and it's slow."""
-        if not (str(self.expression) == "1" or str(self.expression) == "0"):
-            print("start dnf")
-            self._expression = self.expression.to_dnf()  # type: ignore
-            print("end dnf")
-            if not (str(self.expression) == "1" or str(self.expression) == "0"):
-                print("start espresso")
-                expression = espresso_exprs(self.expression)[0]
-                object.__setattr__(self, "_expression", expression)
-                print("end espresso")
+        """Computed with the tree and cached."""
+        tree = self.tree
+        atoms_dictionary = self._atoms_dictionary
+        if atoms_dictionary is None:
+            atoms_dictionary = extract_atoms_dictionary(tree)
+            object.__setattr__(self, "_atoms_dictionary", atoms_dictionary)
+        return atoms_dictionary
+
+    def minimize(self, timeout: float | None = None) -> Bool:
+        """Returns the Espresso minimization (memoized), or self if it takes
+        more than 'timeout' seconds (see minimization.minimize)."""
+        expression = minimize(self.expression, timeout)
+        if expression is self.expression:
+            return self
+        return Bool.from_expression(
+            expression=expression,
+            typeset=self.typeset,
+            atoms_dictionary=self.atoms_dictionary,
+        )
 
     @property
     def cnf(self) -> Cnf:
+        """Computed once and cached."""
+        cnf = self._cnf
+        if cnf is None:
+            cnf = self._build_cnf()
+            object.__setattr__(self, "_cnf", cnf)
+        return cnf
+
+    def _build_cnf(self) -> Cnf:
         cnf_list = []
         cnf = expr(self.expression.to_cnf())
         if isinstance(cnf, AndOp):
@@ -142,8 +248,23 @@ class Bool(Specification):
             )
         return Cnf(cnf_list)  # type: ignore
 
+    @property
+    def tseitin(self) -> Expression:
+        """Equisatisfiable CNF, linear in the size of the expression. Its
+        auxiliary variables are not atoms of the typeset, use 'cnf' for an
+        equivalent CNF."""
+        return tseitin_cnf(self.expression)
+
     @property
     def dnf(self) -> Dnf:
+        """Computed once and cached."""
+        dnf = self._dnf
+        if dnf is None:
+            dnf = self._build_dnf()
+            object.__setattr__(self, "_dnf", dnf)
+        return dnf
+
+    def _build_dnf(self) -> Dnf:
         dnf_list = []
         dnf = expr(self.expression.to_dnf())
         if isinstance(dnf, OrOp):
@@ -234,35 +355,110 @@ class Bool(Specification):
         raise AttributeError
 
     def __iand__(self: Specification, other: Specification) -> Bool:
-        """self &= other Modifies self with the conjunction with other."""
+        """self &= other Returns the conjunction with other, self is not
+        modified since it can be shared (e.g. by interned LTL)."""
         if isinstance(self, Bool) and isinstance(other, Bool):
-            expression = self.expression & other.expression
-            object.__setattr__(self, "_expression", expression)
-            return self
+            return self & other
         raise AttributeError
 
     def __ior__(self: Specification, other: Specification) -> Bool:
-        """self |= other Modifies self with the disjunction with other."""
+        """self |= other Returns the disjunction with other, self is not
+        modified since it can be shared (e.g. by interned LTL)."""
         if isinstance(self, Bool) and isinstance(other, Bool):
-            expression = expr(self.expression | other.expression)
-            object.__setattr__(self, "_expression", expression)
-            return self
+            return self | other
         raise AttributeError
 
+    def __getstate__(self):
+        """Compact state: the formula, the types and the LTL formulas of the
+        atoms, pyeda parses the formula on demand after loading."""
+        atoms_dictionary = self._atoms_dictionary
+        if self._tree is not None:
+            atoms_dictionary = self.atoms_dictionary
+        return {
+            "formula": self.formula,
+            "typeset": self.typeset,
+            "atoms_dictionary": atoms_dictionary,
+        }
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "_init_formula", state["formula"])
+        """The state holds the printed expression"""
+        object.__setattr__(self, "_formula", state["formula"])
+        object.__setattr__(self, "_typeset", state["typeset"])
+        object.__setattr__(self, "_expression", None)
+        object.__setattr__(self, "_tree", None)
+        object.__setattr__(self, "_cnf", None)
+        object.__setattr__(self, "_dnf", None)
+        object.__setattr__(self, "_bdd", None)
+        object.__setattr__(self, "_atoms_dictionary", state["atoms_dictionary"])
+
     @property
     def is_satisfiable(self: Bool) -> bool:
-        if str(self.expression) == "1":
-            return True
-        return len(self.expression.satisfy_one()) > 0
+        """Uses the BDD if it is already built and the Tseitin CNF otherwise:
+        the SAT solver beats the truth table even for few atoms."""
+        if self._bdd is not None:
+            return not self._bdd.is_zero()
+        return is_satisfiable(self.expression)
 
     @property
     def is_valid(self: Bool) -> bool:
-        if str(self.expression) == "1":
-            return True
-        else:
-            return False
+        """Tautologies reduce to the constant one BDD, without a BDD the
+        negation is checked on its Tseitin CNF."""
+        if self._bdd is not None:
+            return self._bdd.is_one()
+        return is_valid(self.expression)
 
     @property
     def is_true_expression(self) -> bool:
         if is_true_string(str(self)):
             return True
+
+
+def bdd_model_count(bdd: BinaryDecisionDiagram, n_variables: int | None = None) -> int:
+    """Number of models over 'n_variables' variables (default: the support
+    of the BDD, which must be included in them).
+
+    pyeda's satisfy_count counts the paths of the BDD, a path skipping k
+    variables stands for 2^k models. Each node is visited once (pyeda's
+    support walks every path as well).
+    """
+    nodes: set[BDDNode] = set()
+    stack = [bdd.node]
+    while stack:
+        node = stack.pop()
+        if node.root > 0 and node not in nodes:
+            nodes.add(node)
+            stack.extend((node.lo, node.hi))
+    support = sorted({node.root for node in nodes})
+    if n_variables is None:
+        n_variables = len(support)
+    level = {uniqid: i for i, uniqid in enumerate(support)}
+    memo: dict[BDDNode, int] = {}
+
+    def node_level(node: BDDNode) -> int:
+        if node is BDDNODEZERO or node is BDDNODEONE:
+            return len(support)
+        return level[node.root]
+
+    def count(node: BDDNode) -> int:
+        """Models over the variables from the level of 'node' on."""
+        if node is BDDNODEZERO:
+            return 0
+        if node is BDDNODEONE:
+            return 1
+        if node not in memo:
+            memo[node] = sum(
+                count(child) << (node_level(child) - node_level(node) - 1)
+                for child in (node.lo, node.hi)
+            )
+        return memo[node]
+
+    root = bdd.node
+    return (count(root) << node_level(root)) << (n_variables - len(support))
+
+
+def _merge_atoms_dictionaries(specs: list[Bool]) -> dict[str, str]:
+    atoms_dictionary: dict[str, str] = {}
+    for spec in specs:
+        atoms_dictionary.update(spec.atoms_dictionary)
+    return atoms_dictionary
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from pyeda.boolalg.bdd import BDDONE, BDDZERO, BinaryDecisionDiagram, bdd2expr, expr2bdd
+from pyeda.boolalg.expr import expr
+from treelib import Tree
+
+from crome_logic.specification import Cnf, Dnf, Specification
+from crome_logic.specification.boolean import Bool, bdd_model_count
+from crome_logic.tools.atomic_propositions import extract_ap
+from crome_logic.tools.string_manipulation import pyeda_syntax_fix
+from crome_logic.typelement.basic import Boolean
+from crome_logic.typeset import Typeset
+
+
+@dataclass(frozen=True)
+class BoolBDD(Specification):
+    """Boolean specification stored as a reduced ordered BDD.
+
+    pyeda keeps all the BDD nodes in a unique table shared by the
+    process, so two BoolBDD representing the same function have the
+    same root node: equality, validity and satisfiability are O(1),
+    conjunction and disjunction work on the diagrams without building
+    expressions. The formula, the trees and the CNF/DNF are those of the
+    equivalent Bool, built on demand.
+    """
+
+    _init_formula: str
+    _typeset: Typeset | None = None
+    _bdd: BinaryDecisionDiagram | None = None
+    _atoms_dictionary: dict[str, str] | None = field(default=None, compare=False)
+    _bool: Bool | None = field(default=None, compare=False)
+
+    def __post_init__(self):
+        if self._typeset is None:
+            set_ap_str = extract_ap(self._init_formula)
+            typeset = Typeset(set(map(lambda x: Boolean(name=x), set_ap_str)))
+            object.__setattr__(self, "_typeset", typeset)
+
+    @property
+    def bdd(self) -> BinaryDecisionDiagram:
+        """Built on first access for unpickled objects."""
+        if self._bdd is None:
+            bdd = expr2bdd(expr(pyeda_syntax_fix(self._init_formula)))
+            object.__setattr__(self, "_bdd", bdd)
+        return self._bdd
+
+    @classmethod
+    def from_bool(cls, spec: Bool) -> BoolBDD:
+        return cls(
+            _init_formula=spec.formula,
+            _typeset=spec.typeset,
+            _bdd=spec.bdd,
+            _atoms_dictionary=spec.atoms_dictionary,
+            _bool=spec,
+        )
+
+    @classmethod
+    def from_bdd(
+        cls,
+        bdd: BinaryDecisionDiagram,
+        typeset: Typeset,
+        atoms_dictionary: dict[str, str] | None,
+    ) -> BoolBDD:
+        """The formula is computed only if needed."""
+        return cls(
+            _init_formula="",
+            _typeset=typeset,
+            _bdd=bdd,
+            _atoms_dictionary=atoms_dictionary,
+        )
+
+    def to_bool(self) -> Bool:
+        """Equivalent Bool, built from the paths of the BDD and cached."""
+        spec = self._bool
+        if spec is None:
+            spec = Bool.from_expression(
+                expression=bdd2expr(self.bdd),
+                typeset=self.typeset,
+                atoms_dictionary=self._atoms_dictionary,
+            )
+            object.__setattr__(self, "_bool", spec)
+        return spec
+
+    @classmethod
+    def conjunction(cls, specs: Iterable[BoolBDD]) -> BoolBDD:
+        return _combine(specs, conjunction=True)
+
+    @classmethod
+    def disjunction(cls, specs: Iterable[BoolBDD]) -> BoolBDD:
+        return _combine(specs, conjunction=False)
+
+    def __eq__(self, other):
+        """Canonical form: same function iff same root node."""
+        if isinstance(other, BoolBDD):
+            return self.bdd.node is other.bdd.node
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.bdd.node)
+
+    def __copy__(self) -> BoolBDD:
+        return self
+
+    def __deepcopy__(self, memo) -> BoolBDD:
+        return self
+
+    @property
+    def formula(self) -> str:
+        return self.to_bool().formula
+
+    def __str__(self):
+        return self.formula
+
+    @property
+    def tree(self) -> Tree:
+        return self.to_bool().tree
+
+    @property
+    def atoms_dictionary(self) -> dict[str, str]:
+        return self.to_bool().atoms_dictionary
+
+    @property
+    def cnf(self) -> Cnf:
+        return self.to_bool().cnf
+
+    @property
+    def dnf(self) -> Dnf:
+        return self.to_bool().dnf
+
+    @property
+    def satisfy_count(self) -> int:
+        """Number of assignments of the variables in the support that satisfy
+        the specification."""
+        return bdd_model_count(self.bdd)
+
+    def __and__(self: Specification, other: Specification) -> BoolBDD:
+        if isinstance(self, BoolBDD) and isinstance(other, BoolBDD):
+            return BoolBDD.from_bdd(
+                bdd=self.bdd & other.bdd,
+                typeset=self.typeset + other.typeset,
+                atoms_dictionary=_merge_atoms_dictionaries([self, other]),
+            )
+        raise AttributeError
+
+    def __or__(self: Specification, other: Specification) -> BoolBDD:
+        if isinstance(self, BoolBDD) and isinstance(other, BoolBDD):
+            return BoolBDD.from_bdd(
+                bdd=self.bdd | other.bdd,
+                typeset=self.typeset + other.typeset,
+                atoms_dictionary=_merge_atoms_dictionaries([self, other]),
+            )
+        raise AttributeError
+
+    def __invert__(self: Specification) -> BoolBDD:
+        if isinstance(self, BoolBDD):
+            return BoolBDD.from_bdd(
+                bdd=~self.bdd,
+                typeset=self.typeset,
+                atoms_dictionary=self._atoms_dictionary,
+            )
+        raise AttributeError
+
+    def __rshift__(self: Specification, other: Specification) -> BoolBDD:
+        if isinstance(self, BoolBDD) and isinstance(other, BoolBDD):
+            return BoolBDD.from_bdd(
+                bdd=~self.bdd | other.bdd,
+                typeset=self.typeset + other.typeset,
+                atoms_dictionary=_merge_atoms_dictionaries([self, other]),
+            )
+        raise AttributeError
+
+    def __iand__(self: Specification, other: Specification) -> BoolBDD:
+        """self &= other Returns the conjunction, self is not modified."""
+        if isinstance(self, BoolBDD) and isinstance(other, BoolBDD):
+            return self & other
+        raise AttributeError
+
+    def __ior__(self: Specification, other: Specification) -> BoolBDD:
+        """self |= other Returns the disjunction, self is not modified."""
+        if isinstance(self, BoolBDD) and isinstance(other, BoolBDD):
+            return self | other
+        raise AttributeError
+
+    def __le__(self, other: BoolBDD) -> bool:
+        """self -> other is valid."""
+        return (~self.bdd | other.bdd).is_one()
+
+    def __getstate__(self):
+        """BDD nodes only live in the unique table of the process, the
+        state stores the formula and the BDD is rebuilt after loading."""
+        return {
+            "formula": self.formula,
+            "typeset": self.typeset,
+            "atoms_dictionary": self._atoms_dictionary,
+        }
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "_init_formula", state["formula"])
+        object.__setattr__(self, "_typeset", state["typeset"])
+        object.__setattr__(self, "_bdd", None)
+        object.__setattr__(self, "_bool", None)
+        object.__setattr__(self, "_atoms_dictionary", state["atoms_dictionary"])
+
+    @property
+    def is_satisfiable(self: BoolBDD) -> bool:
+        return not self.bdd.is_zero()
+
+    @property
+    def is_valid(self: BoolBDD) -> bool:
+        return self.bdd.is_one()
+
+    @property
+    def is_true_expression(self) -> bool:
+        return self.bdd.is_one()
+
+
+def _combine(specs: Iterable[BoolBDD], conjunction: bool) -> BoolBDD:
+    """The empty conjunction is true, the empty disjunction is false."""
+    spec_list = list(specs)
+    bdd = BDDONE if conjunction else BDDZERO
+    """pyeda's ite has no computed table: an operand whose variables are
+    below the accumulated diagram makes it walk every path. Starting from
+    the deepest top variable keeps each step on the new operand"""
+    operands = sorted((s.bdd for s in spec_list), key=lambda b: -b.node.root)
+    for other in operands:
+        bdd = bdd & other if conjunction else bdd | other
+        """Absorbing constant, the other operands do not matter"""
+        if (conjunction and bdd.is_zero()) or (not conjunction and bdd.is_one()):
+            break
+    return BoolBDD.from_bdd(
+        bdd=bdd,
+        typeset=Typeset.from_typesets(s.typeset for s in spec_list),
+        atoms_dictionary=_merge_atoms_dictionaries(spec_list),
+    )
+
+
+def _merge_atoms_dictionaries(specs: list[BoolBDD]) -> dict[str, str] | None:
+    """Only the dictionaries that are already known, None if there is none."""
+    atoms_dictionary: dict[str, str] = {}
+    for spec in specs:
+        if spec._atoms_dictionary is not None:
+            atoms_dictionary.update(spec._atoms_dictionary)
+    if len(atoms_dictionary) == 0:
+        return None
+    return atoms_dictionary
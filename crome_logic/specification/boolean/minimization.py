@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+
+from pyeda.boolalg.expr import Expression, expr
+from pyeda.boolalg.minimization import espresso_exprs
+
+"""Minimized expressions, keyed by the printed expression"""
+_minimized: dict[str, str] = {}
+"""Largest time budget each expression has exceeded"""
+_exceeded: dict[str, float] = {}
+_pending: dict[str, Future] = {}
+_processes: set[BaseProcess] = set()
+_lock = threading.Lock()
+
+
+class MinimizationFailed(Exception):
+    """The minimization process was killed or terminated without a
+    result."""
+
+
+def minimize(expression: Expression, timeout: float | None = None) -> Expression:
+    """Espresso minimization of 'expression', memoized.
+
+    With 'timeout' None it runs in this process. Otherwise it runs in a
+    background process, killed if it takes more than 'timeout' seconds:
+    the unminimized expression is then returned, also by the next calls
+    with a budget that is not larger. Concurrent calls on the same
+    expression share one process.
+    """
+    if expression.is_zero() or expression.is_one():
+        return expression
+    key = str(expression)
+    with _lock:
+        if key in _minimized:
+            return expr(_minimized[key])
+        if timeout is not None and _exceeded.get(key, -1) >= timeout:
+            return expression
+    if timeout is None:
+        result = _espresso(key)
+        with _lock:
+            _minimized[key] = result
+        return expr(result)
+    try:
+        return expr(_minimize_in_process(key, timeout))
+    except (FutureTimeoutError, CancelledError, MinimizationFailed):
+        return expression
+
+
+def _minimize_in_process(key: str, timeout: float) -> str:
+    """The first caller runs the process, the others wait for its
+    future."""
+    with _lock:
+        future = _pending.get(key)
+        if future is None:
+            future = Future()
+            _pending[key] = future
+            future.add_done_callback(lambda f: _store(key, f))
+            owner = True
+        else:
+            owner = False
+    if not owner:
+        return future.result(timeout=timeout)
+    try:
+        result = _run(key, timeout)
+    except FutureTimeoutError as e:
+        with _lock:
+            _exceeded[key] = max(timeout, _exceeded.get(key, timeout))
+        future.set_exception(e)
+        raise
+    except (CancelledError, MinimizationFailed) as e:
+        future.set_exception(e)
+        raise
+    future.set_result(result)
+    return result
+
+
+def _run(key: str, timeout: float) -> str:
+    """Runs the minimization in a new process, killed after 'timeout'
+    seconds."""
+    """The fork server starts the processes from a process without threads,
+    forking this one could deadlock on a lock held by the nuXmv pool or
+    checker threads"""
+    context = multiprocessing.get_context("forkserver")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_worker, args=(key, sender), daemon=True)
+    with _lock:
+        if key not in _pending:
+            """Dropped by shutdown()"""
+            raise CancelledError()
+        process.start()
+        _processes.add(process)
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            raise FutureTimeoutError()
+        return receiver.recv()
+    except EOFError:
+        raise MinimizationFailed("Minimization process terminated")
+    finally:
+        receiver.close()
+        process.kill()
+        process.join()
+        with _lock:
+            _processes.discard(process)
+
+
+def _worker(formula: str, sender: Connection) -> None:
+    """Runs in the background processes, strings travel between them."""
+    sender.send(_espresso(formula))
+    sender.close()
+
+
+def _store(key: str, future: Future) -> None:
+    with _lock:
+        if _pending.get(key) is future:
+            del _pending[key]
+        if future.exception() is None:
+            _minimized[key] = future.result()
+
+
+def _espresso(formula: str) -> str:
+    dnf = expr(formula).to_dnf()
+    if dnf.is_zero() or dnf.is_one():
+        return str(dnf)
+    return str(espresso_exprs(dnf)[0])
+
+
+def shutdown() -> None:
+    """Kills the background processes, pending minimizations are dropped
+    and return the unminimized expression."""
+    with _lock:
+        processes = list(_processes)
+        _pending.clear()
+    for process in processes:
+        process.kill()
+        process.join()
+
+
+"""A running minimization would otherwise keep the interpreter alive"""
+atexit.register(shutdown)
@@ -3,6 +3,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import pygraphviz as pgv
+from pyeda.boolalg.expr import (
+    AndOp,
+    Complement,
+    Constant,
+    Expression,
+    ImpliesOp,
+    NotOp,
+    OrOp,
+    Variable,
+)
 
 from crome_logic.specification.string_logic import and_, implies_, not_, or_
 from crome_logic.tools.string_manipulation import spot_syntax_fix
@@ -81,3 +91,24 @@ def convert_dict_to_spot_string(operation_graph: dict) -> str:
         del operation_graph[key]
 
     return convert_dict_to_spot_string(operation_graph)
+
+
+def expression_to_spot_string(expression: Expression) -> str:
+    """Converts a pyeda expression to a spot string walking its tree.
+
+    Produces the same strings as dot_to_spot_string, without going
+    through Graphviz.
+    """
+    if isinstance(expression, (Variable, Complement, Constant)):
+        return spot_syntax_fix(str(expression))
+    children = [expression_to_spot_string(x) for x in expression.xs]
+    if isinstance(expression, AndOp):
+        return and_(children, brackets=True)
+    elif isinstance(expression, OrOp):
+        return or_(children)
+    elif isinstance(expression, ImpliesOp):
+        return implies_(children[0], children[1])
+    elif isinstance(expression, NotOp):
+        return not_(children[0])
+    else:
+        raise Exception("Attribute unkown")
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+from pyeda.boolalg.expr import (
+    AndOp,
+    Complement,
+    Constant,
+    EqualOp,
+    Expression,
+    IfThenElseOp,
+    ImpliesOp,
+    NotOp,
+    OrOp,
+    Variable,
+    XorOp,
+)
+
+"""Above this number of atoms the tables (2^n bits per column) are not
+built, use the BDD or the SAT solver"""
+MAX_ATOMS = 20
+
+_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+"""Value of the variables 0..5 in the 64 rows of a word: variable i is
+true in row r if bit i of r is set"""
+_WORD_PATTERNS = (
+    0xAAAAAAAAAAAAAAAA,
+    0xCCCCCCCCCCCCCCCC,
+    0xF0F0F0F0F0F0F0F0,
+    0xFF00FF00FF00FF00,
+    0xFFFF0000FFFF0000,
+    0xFFFFFFFF00000000,
+)
+
+
+@dataclass(frozen=True)
+class TruthTable:
+    """Values of an expression for all the 2^n assignments of 'variables',
+    packed 64 rows per uint64 word. Row r assigns variables[i] the bit i
+    of r, the bits beyond the last row are zero."""
+
+    variables: tuple[str, ...]
+    words: np.ndarray
+
+    @property
+    def n_rows(self) -> int:
+        return 1 << len(self.variables)
+
+    @property
+    def is_satisfiable(self) -> bool:
+        return bool(self.words.any())
+
+    @property
+    def is_valid(self) -> bool:
+        return self.model_count == self.n_rows
+
+    @property
+    def model_count(self) -> int:
+        return int(np.unpackbits(self.words.view(np.uint8)).sum())
+
+    def model(self) -> dict[str, bool] | None:
+        """First satisfying assignment, None if there is none."""
+        non_zero = np.flatnonzero(self.words)
+        if len(non_zero) == 0:
+            return None
+        w = int(non_zero[0])
+        word = int(self.words[w])
+        row = w * 64 + ((word & -word).bit_length() - 1)
+        return {v: bool((row >> i) & 1) for i, v in enumerate(self.variables)}
+
+    def __eq__(self, other):
+        if isinstance(other, TruthTable):
+            return self.variables == other.variables and bool(
+                np.array_equal(self.words, other.words)
+            )
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.variables, self.words.tobytes()))
+
+
+def truth_table(
+    expression: Expression, variables: Iterable[Variable] | None = None
+) -> TruthTable:
+    """Evaluates 'expression' on all the assignments at once, one bitwise
+    numpy operation per node of the expression.
+
+    'variables' must include the support of the expression, it defaults
+    to it (sorted by name).
+    """
+    if variables is None:
+        variables = expression.support
+    variables = sorted(set(variables), key=str)
+    n = len(variables)
+    if n > MAX_ATOMS:
+        raise Exception(f"{n} atoms, truth tables are limited to {MAX_ATOMS}")
+    if not expression.support <= set(variables):
+        raise Exception("The variables do not include the support of the expression")
+    n_words = max(1, (1 << n) // 64)
+    columns = {v: _column(i, n_words) for i, v in enumerate(variables)}
+    words = _evaluate(expression, columns, n_words, {})
+    if n < 6:
+        words = words & np.uint64((1 << (1 << n)) - 1)
+    return TruthTable(variables=tuple(str(v) for v in variables), words=words)
+
+
+def equivalent(expression: Expression, other: Expression) -> bool:
+    """Compares the tables over the union of the supports."""
+    variables = expression.support | other.support
+    return truth_table(expression, variables) == truth_table(other, variables)
+
+
+def _column(i: int, n_words: int) -> np.ndarray:
+    if i < 6:
+        return np.full(n_words, _WORD_PATTERNS[i], dtype=np.uint64)
+    """Whole words are true or false, in blocks of 2^(i - 6) words"""
+    selected = (np.arange(n_words) >> (i - 6)) & 1
+    return np.where(selected == 1, _ONES, np.uint64(0)).astype(np.uint64)
+
+
+def _evaluate(
+    expression: Expression,
+    columns: dict[Variable, np.ndarray],
+    n_words: int,
+    memo: dict[Expression, np.ndarray],
+) -> np.ndarray:
+    """Shared subexpressions are evaluated once."""
+    if expression in memo:
+        return memo[expression]
+    if isinstance(expression, Constant):
+        fill = _ONES if expression.is_one() else np.uint64(0)
+        return np.full(n_words, fill, dtype=np.uint64)
+    if isinstance(expression, Variable):
+        return columns[expression]
+    if isinstance(expression, Complement):
+        return ~columns[~expression]
+    xs = [_evaluate(x, columns, n_words, memo) for x in expression.xs]
+    if isinstance(expression, AndOp):
+        result = np.bitwise_and.reduce(xs)
+    elif isinstance(expression, OrOp):
+        result = np.bitwise_or.reduce(xs)
+    elif isinstance(expression, XorOp):
+        result = np.bitwise_xor.reduce(xs)
+    elif isinstance(expression, NotOp):
+        result = ~xs[0]
+    elif isinstance(expression, ImpliesOp):
+        result = ~xs[0] | xs[1]
+    elif isinstance(expression, EqualOp):
+        result = np.bitwise_and.reduce(xs) | ~np.bitwise_or.reduce(xs)
+    elif isinstance(expression, IfThenElseOp):
+        result = (xs[0] & xs[1]) | (~xs[0] & xs[2])
+    else:
+        raise Exception(f"Operator not supported: {type(expression).__name__}")
+    memo[expression] = result
+    return result
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pyeda.boolalg.expr import Constant, Expression, Literal
+
+"""Prefix of the auxiliary variables, not a valid atom name in spot"""
+AUX_VARIABLE = "__tseitin"
+
+
+def tseitin_cnf(expression: Expression) -> Expression:
+    """Equisatisfiable CNF with one auxiliary variable per operator.
+
+    Its size is linear in the size of 'expression', while to_cnf() can
+    be exponential (e.g. on disjunctions of conjunctions). The models
+    restricted to the original variables are the models of 'expression'.
+    """
+    nnf = expression.to_nnf()
+    """pyeda's tseitin() fails when the NNF is a constant or a literal,
+    they are already in CNF"""
+    if nnf.is_cnf() or isinstance(nnf, (Constant, Literal)):
+        return nnf
+    return nnf.tseitin(auxvarname=AUX_VARIABLE)
+
+
+def is_satisfiable(expression: Expression) -> bool:
+    """Solves the Tseitin CNF with PicoSAT."""
+    cnf = tseitin_cnf(expression)
+    if cnf.is_zero():
+        return False
+    if cnf.is_one():
+        return True
+    return cnf.satisfy_one() is not None
+
+
+def is_valid(expression: Expression) -> bool:
+    return not is_satisfiable(~expression)
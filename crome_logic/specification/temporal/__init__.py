@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from dataclasses import dataclass, fields
+import threading
+from abc import ABCMeta
+from dataclasses import dataclass, field
+from typing import Iterable
+from weakref import WeakValueDictionary
 
 import spot
 from treelib import Tree
@@ -9,16 +12,25 @@ from treelib import Tree
 from crome_logic.patterns import Pattern
 from crome_logic.specification import Cnf, Dnf, Specification
 from crome_logic.specification.boolean import Bool
+from crome_logic.specification.boolean.bdd import BoolBDD
 from crome_logic.specification.temporal.tools import transform_spot_tree
-from crome_logic.specification.tools import is_true_string
 from crome_logic.specification.trees import (
     boolean_tree_to_formula,
-    extract_atoms_dictionary,
     gen_atoms_tree,
     gen_ltl_tree,
 )
 from crome_logic.tools.atomic_propositions import extract_ap
-from crome_logic.tools.nuxmv import check_satisfiability, check_validity
+from crome_logic.tools.checkers import (
+    Checker,
+    check_batch,
+    check_satisfiability,
+    check_satisfiability_async,
+    check_validity,
+    check_validity_async,
+)
+from crome_logic.tools.nuxmv import CheckType, get_trace
+from crome_logic.tools.nuxmv.trace import Trace
+from crome_logic.tools.verdict import Verdict
 from crome_logic.typelement.basic import (
     Boolean,
     BooleanControllable,
@@ -27,33 +39,98 @@ from crome_logic.typelement.basic import (
 from crome_logic.typelement.robotic import BooleanLocation, BooleanSensor
 from crome_logic.typeset import Typeset
 
+_interned: WeakValueDictionary = WeakValueDictionary()
+_interned_lock = threading.Lock()
+
+
+class _Interning(ABCMeta):
+    """Metaclass of LTL, equal formulas share one instance.
+
+    Two formulas are equal if they have the same spot formula, kind and
+    types, including the attributes the rules are derived from. The
+    instance lives as long as someone references it.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        instance = super().__call__(*args, **kwargs)
+        key = (cls, instance.key)
+        with _interned_lock:
+            existing = _interned.get(key)
+            if existing is not None:
+                return existing
+            _interned[key] = instance
+        return instance
+
 
 @dataclass(frozen=True)
-class LTL(Specification):
-    _init_formula: str | Pattern
+class LTL(Specification, metaclass=_Interning):
+    """LTL formula, instances are interned and must not be modified: the
+    tree, the boolean abstraction, the rules and the verdicts are
+    computed once and shared."""
+
+    _init_formula: str | Pattern | spot.formula
     _typeset: Typeset | None = None
     _boolean: Bool | None = None
     _kind: Specification.Kind = Specification.Kind.UNDEFINED
     _expression: spot.formula | None = None
     _tree: Tree | None = None
     _parse_env_systems: bool = False
+    _rules: dict[str, LTL] = field(default_factory=dict)
+    _verdicts: dict[CheckType, Verdict] = field(default_factory=dict)
+    _refinements: dict[tuple, Verdict] = field(default_factory=dict)
+    _cnf: Cnf | None = None
+    _dnf: Dnf | None = None
 
     @property
     def boolean(self) -> Bool:
+        """Boolean abstraction (temporal subformulas become atoms), built
+        on first access."""
+        if self._boolean is None:
+            atom_tree = gen_atoms_tree(spot_f=self.expression)
+            boolean = Bool(
+                _init_formula=boolean_tree_to_formula(atom_tree), _tree=atom_tree
+            )
+            object.__setattr__(self, "_boolean", boolean)
         if isinstance(self._boolean, Bool):
             return self._boolean
         raise AttributeError
 
+    @property
+    def boolean_bdd(self) -> BoolBDD:
+        """Boolean abstraction stored as a BDD, for large specifications:
+        equivalence, validity and conjunctions of abstractions work on the
+        diagrams. The BDD is built once and kept by the boolean
+        abstraction."""
+        return BoolBDD.from_bool(self.boolean)
+
+    @property
+    def atoms_dictionary(self) -> dict[str, str]:
+        """Maps the atoms of the boolean abstraction to their LTL formulas."""
+        return self.boolean.atoms_dictionary
+
     @property
     def kind(self) -> Specification.Kind:
         return self._kind
 
+    @property
+    def key(self) -> tuple:
+        """Identifies the formula: spot formula, kind and types. The key of
+        the typeset covers the mutex groups, adjacency sets and
+        refinements, so it also fixes the rules and the verdicts."""
+        return self.expression, self.kind, self.typeset.key
+
     @property
     def expression(self) -> spot.formula:
+        """Parsed on first access for unpickled objects."""
+        if self._expression is None:
+            self._initialize_external_libraries_objects(self._init_formula)
         return self._expression
 
     @property
     def tree(self) -> Tree:
+        if self._tree is None:
+            tree: Tree = gen_ltl_tree(spot_f=self.expression)
+            object.__setattr__(self, "_tree", tree)
         return self._tree
 
     def __post_init__(self):
@@ -80,27 +157,97 @@ class LTL(Specification):
             # TODO: introduce the world
         object.__setattr__(self, "_typeset", typeset)
 
-    def _initialize_external_libraries_objects(self, formula: str):
-        expression = transform_spot_tree(spot.formula(formula))
-        object.__setattr__(self, "_expression", expression)
-        if self._boolean is None:
-            atom_tree = gen_atoms_tree(spot_f=self.expression)
-            boolean = Bool(
-                _init_formula=boolean_tree_to_formula(atom_tree), _tree=atom_tree
-            )
-            object.__setattr__(self, "_boolean", boolean)
-        tree: Tree = gen_ltl_tree(spot_f=self.expression)
-        object.__setattr__(self, "_tree", tree)
+    def _initialize_external_libraries_objects(self, formula: str | spot.formula):
+        """Only the spot formula is built here, the tree and the boolean
+        abstraction are built on first access.
+
+        A given '_expression' is already transformed and is kept as is.
+        """
+        if self._expression is None:
+            if isinstance(formula, str):
+                formula = spot.formula(formula)
+            expression = transform_spot_tree(formula)
+            object.__setattr__(self, "_expression", expression)
+        object.__setattr__(self, "_tree", None)
+
+    @property
+    def init_formula(self) -> str:
+        if isinstance(self._init_formula, spot.formula):
+            return str(self._init_formula)
+        return super().init_formula
 
     @classmethod
     def from_pattern(cls, formula: Pattern, typeset: Typeset | None = None) -> LTL:
         return cls(_init_formula=str(formula), _typeset=typeset)
 
+    @classmethod
+    def from_spot(
+        cls,
+        formula: spot.formula,
+        typeset: Typeset | None = None,
+        kind: Specification.Kind = Specification.Kind.UNDEFINED,
+    ) -> LTL:
+        """Builds an LTL from a spot formula, without printing and parsing
+        it."""
+        return cls(_init_formula=formula, _typeset=typeset, _kind=kind)
+
+    @classmethod
+    def conjunction(cls, specs: Iterable[LTL]) -> LTL:
+        """Conjunction of all the specifications, built in one pass: one
+        spot formula, one typeset merge and (on access) one boolean
+        abstraction."""
+        specs = [s for s in specs if not s.is_true_expression]
+        if len(specs) == 0:
+            return LTL("TRUE")
+        if len(specs) == 1:
+            spec = specs[0]
+            return LTL._compose(spec.expression, spec.typeset, spec._boolean)
+        return LTL._compose(
+            spot.formula.And([s.expression for s in specs]),
+            Typeset.from_typesets(s.typeset for s in specs),
+        )
+
+    @classmethod
+    def disjunction(cls, specs: Iterable[LTL]) -> LTL:
+        """Disjunction of all the specifications, built in one pass."""
+        specs = list(specs)
+        if any(s.is_true_expression for s in specs):
+            return LTL("TRUE")
+        if len(specs) == 0:
+            return LTL("FALSE")
+        if len(specs) == 1:
+            spec = specs[0]
+            return LTL._compose(spec.expression, spec.typeset, spec._boolean)
+        return LTL._compose(
+            spot.formula.Or([s.expression for s in specs]),
+            Typeset.from_typesets(s.typeset for s in specs),
+        )
+
+    @classmethod
+    def _compose(
+        cls, expression: spot.formula, typeset: Typeset, boolean: Bool | None = None
+    ) -> LTL:
+        """LTL of an expression built from transformed expressions with
+        And, Or, Implies or Not.
+
+        The transformations only rewrite G, F and X nodes, the new top
+        node does not need them and the children already had them.
+        """
+        return cls(
+            _init_formula=expression,
+            _expression=expression,
+            _typeset=typeset,
+            _boolean=boolean,
+        )
+
     def __hash__(self: LTL):
         return hash(str(self))
 
     @property
     def formula(self) -> str:
+        if self._expression is None:
+            """Unpickled: '_init_formula' is the printed expression"""
+            return str(self._init_formula)
         return str(self.expression)
 
     @property
@@ -114,20 +261,12 @@ class LTL(Specification):
     def __str__(self):
         return self.formula
 
-    def __deepcopy__(self: LTL, memo):
-        cls = self.__class__
-        result = cls.__new__(cls)
-        for field in fields(cls):
-            if not (
-                field.name == "_boolean"
-                or field.name == "_expression"
-                or field.name == "_tree"
-            ):
-                object.__setattr__(
-                    result, field.name, deepcopy(getattr(self, field.name))
-                )
-        result._initialize_external_libraries_objects(result.init_formula)
-        return result
+    def __copy__(self: LTL) -> LTL:
+        return self
+
+    def __deepcopy__(self: LTL, memo) -> LTL:
+        """LTL objects are immutable (and interned), copies share them."""
+        return self
 
     @property
     def summary(self) -> str:
@@ -153,45 +292,57 @@ class LTL(Specification):
 
     @property
     def cnf(self) -> Cnf:
-        atoms_cnf = self.boolean.cnf.clauses
-        cnf_list = []
-        atoms_dictionary = extract_atoms_dictionary(self.boolean.tree)
-        for clauses in atoms_cnf:
-            atoms = set()
-            for atom in clauses:
-                atom_str: str = str(atom)
-                if atom_str.startswith("!"):
-                    ltl_formula = f"!{atoms_dictionary[atom_str[1:]]}"
-                else:
-                    ltl_formula = atoms_dictionary[str(atom)]
-                ltl_object = LTL(
-                    _init_formula=ltl_formula,
-                    _typeset=self.typeset.get_sub_typeset(ltl_formula),
-                )
-                atoms.add(ltl_object)
-            cnf_list.append(atoms)
-        return Cnf(cnf_list)  # type: ignore
+        """Computed once and cached, the literals are interned LTL."""
+        cnf = self._cnf
+        if cnf is None:
+            clauses = self._literal_clauses(self.boolean.cnf.clauses)
+            cnf = Cnf(clauses)  # type: ignore
+            object.__setattr__(self, "_cnf", cnf)
+        return cnf
 
     @property
     def dnf(self) -> Dnf:
-        atoms_dnf = self.boolean.dnf.clauses
-        dnf_list = []
-        atoms_dictionary = extract_atoms_dictionary(self.boolean.tree)
-        for clauses in atoms_dnf:
-            atoms = set()
-            for atom in clauses:
+        """Computed once and cached, the literals are interned LTL."""
+        dnf = self._dnf
+        if dnf is None:
+            clauses = self._literal_clauses(self.boolean.dnf.clauses)
+            dnf = Dnf(clauses)  # type: ignore
+            object.__setattr__(self, "_dnf", dnf)
+        return dnf
+
+    def _literal_clauses(self, clauses: list[set[Specification]]) -> list[set[LTL]]:
+        """Maps the literals of the boolean abstraction back to LTL,
+        composing the spot formulas of the atoms (nothing is parsed)."""
+        atoms = self._atoms_formulas()
+        literals: dict[str, LTL] = {}
+        ltl_clauses = []
+        for clause in clauses:
+            ltl_clause = set()
+            for atom in clause:
                 atom_str: str = str(atom)
-                if atom_str.startswith("!"):
-                    ltl_formula = f"!{atoms_dictionary[atom_str[1:]]}"
-                else:
-                    ltl_formula = atoms_dictionary[str(atom)]
-                ltl_object = LTL(
-                    _init_formula=ltl_formula,
-                    _typeset=self.typeset.get_sub_typeset(ltl_formula),
-                )
-                atoms.add(ltl_object)
-            dnf_list.append(atoms)
-        return Dnf(dnf_list)  # type: ignore
+                if atom_str not in literals:
+                    if atom_str.startswith("!"):
+                        formula = spot.formula.Not(atoms[atom_str[1:]])
+                    else:
+                        formula = atoms[atom_str]
+                    literals[atom_str] = LTL._compose(
+                        formula, self.typeset.get_sub_typeset(formula)
+                    )
+                ltl_clause.add(literals[atom_str])
+            ltl_clauses.append(ltl_clause)
+        return ltl_clauses
+
+    def _atoms_formulas(self) -> dict[str, spot.formula]:
+        """Spot formula of each atom of the boolean abstraction."""
+        formulas = {}
+        for node in self.boolean.tree.leaves():
+            formula = node.data["spot_f"]
+            if str(formula) != node.data["generator"]:
+                """The tree was built from the boolean formula, the
+                generator holds the LTL formula of the atom"""
+                formula = transform_spot_tree(spot.formula(node.data["generator"]))
+            formulas[node.tag] = formula
+        return formulas
 
     def export_to_json(self):
         json_content = {}
@@ -216,77 +367,32 @@ class LTL(Specification):
         return json_content
 
     def __iand__(self: Specification, other: Specification) -> LTL:
-        """self &= other Modifies self with the conjunction with other."""
+        """self &= other Returns the conjunction with other, self is
+        interned and is not modified."""
         if not (isinstance(self, LTL) and isinstance(other, LTL)):
             raise AttributeError
-        if self.is_true_expression:
-            init_formula = deepcopy(other.formula)
-            typeset = deepcopy(other.typeset)
-            boolean = deepcopy(other.boolean)
-            object.__setattr__(self, "_init_formula", init_formula)
-            object.__setattr__(self, "_typeset", typeset)
-            object.__setattr__(self, "_boolean", boolean)
-
-            self.__post_init__()  # type: ignore
-
-            return self
-
-        if other.is_true_expression:
-            return self
-
-        init_formula = f"({str(self)}) & ({str(other)})"
-        typeset = self.typeset + other.typeset
-        boolean = self.boolean & other.boolean
-
-        object.__setattr__(self, "_init_formula", init_formula)
-        object.__setattr__(self, "_typeset", typeset)
-        object.__setattr__(self, "_boolean", boolean)
-
-        self.__post_init__()  # type: ignore
-
-        return self
+        return self & other
 
     def __ior__(self: Specification, other: Specification) -> LTL:
-        """self |= other Modifies self with the disjunction with other."""
+        """self |= other Returns the disjunction with other, self is
+        interned and is not modified."""
         if not (isinstance(self, LTL) and isinstance(other, LTL)):
             raise AttributeError
-        if self.is_true_expression or other.is_true_expression:
-            init_formula = f"TRUE"
-        else:
-            init_formula = f"({str(self)}) | ({str(other)})"
-
-        typeset = self.typeset + other.typeset
-        boolean = self.boolean | other.boolean
-        object.__setattr__(self, "_init_formula", init_formula)
-        object.__setattr__(self, "_typeset", typeset)
-        object.__setattr__(self, "_boolean", boolean)
-
-        self.__post_init__()  # type: ignore
-
-        return self
+        return self | other
 
     def __and__(self: Specification, other: Specification) -> LTL:
         """self & other Returns a new LTL with the conjunction with other."""
         if not (isinstance(self, LTL) and isinstance(other, LTL)):
             raise AttributeError
         if self.is_true_expression:
-            return LTL(
-                _init_formula=str(other),
-                _boolean=other.boolean,
-                _typeset=other.typeset,
-            )
+            return LTL._compose(other.expression, other.typeset, other._boolean)
 
         if other.is_true_expression:
-            return LTL(
-                _init_formula=str(self),
-                _boolean=self.boolean,
-                _typeset=self.typeset,
-            )
+            return LTL._compose(self.expression, self.typeset, self._boolean)
 
-        return LTL(
-            _init_formula=f"({str(self)}) & ({str(other)})",
-            _boolean=self.boolean & other.boolean,
-            _typeset=self.typeset + other.typeset,
+        return LTL._compose(
+            spot.formula.And([self.expression, other.expression]),
+            self.typeset + other.typeset,
         )
 
     def __or__(self: Specification, other: Specification) -> LTL:
@@ -296,21 +402,16 @@ class LTL(Specification):
         if self.is_true_expression or other.is_true_expression:
             return LTL("TRUE")
 
-        return LTL(
-            _init_formula=f"({str(self)}) | ({str(other)})",
-            _boolean=self.boolean | other.boolean,
-            _typeset=self.typeset + other.typeset,
+        return LTL._compose(
+            spot.formula.Or([self.expression, other.expression]),
+            self.typeset + other.typeset,
         )
 
     def __invert__(self: Specification) -> LTL:
         """Returns a new LTL with the negation of self."""
         if not isinstance(self, LTL):
             raise AttributeError
-        return LTL(
-            _init_formula=f"!({self.expression})",
-            _boolean=~self.boolean,
-            _typeset=self.typeset,
-        )
+        return LTL._compose(spot.formula.Not(self.expression), self.typeset)
 
     def __rshift__(self: Specification, other: Specification) -> LTL:
         """>> Returns a new LTL that is the result of self -> other
@@ -318,145 +419,193 @@ class LTL(Specification):
         if not (isinstance(self, LTL) and isinstance(other, LTL)):
             raise AttributeError
         if self.is_true_expression:
-            return LTL(
-                _init_formula=str(other),
-                _boolean=other.boolean,
-                _typeset=other.typeset,
-            )
+            return LTL._compose(other.expression, other.typeset, other._boolean)
 
-        return LTL(
-            _init_formula=f"({self.expression}) -> ({other.expression})",
-            _boolean=self.boolean >> other.boolean,
-            _typeset=self.typeset + other.typeset,
+        return LTL._compose(
+            spot.formula.Implies(self.expression, other.expression),
+            self.typeset + other.typeset,
         )
 
     @property
     def adjacency_and_mutex_rules(self) -> LTL:
-        return self.adjacency_rules & self.mutex_rules
+        return LTL.conjunction([self.adjacency_rules, self.mutex_rules])
 
     @property
     def adjacency_rules(self) -> LTL:
         from crome_logic.specification.rules_extractors import extract_adjacency_rules
 
-        return extract_adjacency_rules(self.typeset)
+        if "adjacency" not in self._rules:
+            rules = extract_adjacency_rules(self.typeset)
+            if not isinstance(rules, LTL):
+                raise AttributeError
+            self._rules["adjacency"] = rules
+        return self._rules["adjacency"]
 
     @property
     def mutex_rules(self) -> LTL:
         from crome_logic.specification.rules_extractors import extract_mutex_rules
 
-        return extract_mutex_rules(self.typeset)
+        if "mutex" not in self._rules:
+            rules = extract_mutex_rules(self.typeset)
+            if not isinstance(rules, LTL):
+                raise AttributeError
+            self._rules["mutex"] = rules
+        return self._rules["mutex"]
 
     @property
     def refinement_rules(self) -> LTL:
         from crome_logic.specification.rules_extractors import extract_refinement_rules
 
-        return extract_refinement_rules(self.typeset)
+        if "refinement" not in self._rules:
+            rules = extract_refinement_rules(self.typeset)
+            if not isinstance(rules, LTL):
+                raise AttributeError
+            self._rules["refinement"] = rules
+        return self._rules["refinement"]
 
     @property
-    def is_satisfiable(self: LTL) -> bool:
-        # print("CHECKSATNOW")
-        # print(self)
-        #
-        # adj = self.adjacency_rules
-        # print(adj)
-        #
-        # mtx = self.mutex_rules
-        # # print(mtx)
-
-        new_f = self & self.adjacency_and_mutex_rules
-        # print(new_f)
+    def is_satisfiable(self: LTL) -> Verdict:
+        """Three-valued: UNKNOWN if the check ran out of time or memory,
+        it is falsy like FALSE."""
+        return self.check_satisfiability()
+
+    def check_satisfiability(self, checker: Checker | str | None = None) -> Verdict:
+        """Satisfiability under the adjacency and mutex rules, 'checker'
+        selects the backend (default in crome_logic.tools.checkers). The
+        memoized verdict is used only if no checker is given."""
+        if checker is None and CheckType.SATISFIABILITY in self._verdicts:
+            return self._verdicts[CheckType.SATISFIABILITY]
+        new_f = self._satisfiability_formula
+        verdict = check_satisfiability(
+            str(new_f), new_f.typeset.to_str_nuxmv(), checker=checker
+        )
+        return self._store_verdict(CheckType.SATISFIABILITY, verdict)
 
-        return check_satisfiability(str(new_f), new_f.typeset.to_str_nuxmv())
+    def _store_verdict(self, check_type: CheckType, verdict: Verdict) -> Verdict:
+        """Verdicts are shared by all the users of the interned instance,
+        UNKNOWN is not stored so that the check can be retried."""
+        if verdict.is_known:
+            self._verdicts[check_type] = verdict
+        return verdict
 
     @property
-    def is_valid(self: LTL) -> bool:
+    def _satisfiability_formula(self) -> LTL:
+        return self & self.adjacency_and_mutex_rules
 
-        if isinstance(self.kind, LTL.Kind.Rule):
-            return check_validity(str(self), self.typeset.to_str_nuxmv())
+    def _refinement_formula(self, other: LTL) -> LTL:
+        """Formula that is valid iff self is a refinement of other."""
+        s_r = self.refinement_rules
+        s_a = self.adjacency_rules
+        s_m = self.mutex_rules
+        return LTL.conjunction([s_r, s_a, s_m, self]) >> other
 
-        # print(f"EXT:\n{self.refinement_rules}")
-        # print(f"ADJ:\n{self.adjacency_rules}")
-        # print(f"MTX:\n{self.mutex_rules}")
-        # print(f"VAL:\n{self}")
-        #
-        # new_f = (self.refinement_rules & self.adjacency_and_mutex_rules) >> self
+    @property
+    def is_valid(self: LTL) -> Verdict:
+        """Three-valued: UNKNOWN if the check ran out of time or memory,
+        it is falsy like FALSE."""
+        return self.check_validity()
+
+    def check_validity(self, checker: Checker | str | None = None) -> Verdict:
+        """Validity of the formula, 'checker' selects the backend (default in
+        crome_logic.tools.checkers). The memoized verdict is used only if no
+        checker is given."""
+        if checker is None and CheckType.VALIDITY in self._verdicts:
+            return self._verdicts[CheckType.VALIDITY]
+        verdict = check_validity(
+            str(self), self.typeset.to_str_nuxmv(), checker=checker
+        )
+        return self._store_verdict(CheckType.VALIDITY, verdict)
+
+    async def check_satisfiability_async(
+        self, checker: Checker | str | None = None
+    ) -> Verdict:
+        """Same as check_satisfiability, without blocking the event loop."""
+        if checker is None and CheckType.SATISFIABILITY in self._verdicts:
+            return self._verdicts[CheckType.SATISFIABILITY]
+        new_f = self._satisfiability_formula
+        verdict = await check_satisfiability_async(
+            str(new_f), new_f.typeset.to_str_nuxmv(), checker=checker
+        )
+        return self._store_verdict(CheckType.SATISFIABILITY, verdict)
+
+    async def check_validity_async(
+        self, checker: Checker | str | None = None
+    ) -> Verdict:
+        """Same as check_validity, without blocking the event loop."""
+        if checker is None and CheckType.VALIDITY in self._verdicts:
+            return self._verdicts[CheckType.VALIDITY]
+        verdict = await check_validity_async(
+            str(self), self.typeset.to_str_nuxmv(), checker=checker
+        )
+        return self._store_verdict(CheckType.VALIDITY, verdict)
 
-        new_f = self
+    def counterexample(self, other: LTL | None = None) -> Trace | None:
+        """Trace showing why self is not a refinement of other, or why self
+        is not valid if other is None.
 
-        return check_validity(str(new_f), new_f.typeset.to_str_nuxmv())
+        The trace of a check decided by nuXmv is kept from the same run,
+        otherwise nuXmv is called once. Returns None if the refinement
+        (or the validity) holds.
+        """
+        if other is None:
+            return get_trace(str(self), self.typeset.to_str_nuxmv())
+        self_sat = self._satisfiability_formula
+        other_sat = other._satisfiability_formula
+        new_f = self._refinement_formula(other)
+        typeset = self_sat.typeset + other_sat.typeset + new_f.typeset
+        return get_trace(str(new_f), typeset.to_str_nuxmv())
+
+    def witness(self) -> Trace | None:
+        """Trace satisfying self under the adjacency and mutex rules, None if
+        self is not satisfiable."""
+        new_f = self._satisfiability_formula
+        return get_trace(
+            str(new_f), new_f.typeset.to_str_nuxmv(), CheckType.SATISFIABILITY
+        )
 
     @property
     def is_true_expression(self) -> bool:
-        if is_true_string(str(self)):
-            return True
+        return self.expression.is_tt()
 
     def __lt__(self, other: LTL):
         """self < other.
 
         True if self is a refinement but not equal to other
         """
-        return self.__le__(other) and self.__ne__(other)
+        return Verdict.of(self.__le__(other)) & self.__ne__(other)
 
-    def __le__(self: LTL, other: LTL):
+    def __le__(self: LTL, other: LTL) -> Verdict:
         """self <= other.
 
-        True if self is a refinement of other
+        True if self is a refinement of other, UNKNOWN if a check ran out
+        of time or memory
         """
         """Check if (self -> other) is valid"""
+        if other.key in self._refinements:
+            return self._refinements[other.key]
+        results = _check_all(
+            [
+                (self, CheckType.SATISFIABILITY),
+                (other, CheckType.SATISFIABILITY),
+                (self._refinement_formula(other), CheckType.VALIDITY),
+            ]
+        )
+        return self._store_refinement(other, Verdict.all(results))
 
-        # print(f"REFCHECK\n{str(self)}\n{str(other)}")
-        if not self.is_satisfiable:
-            return False
-        if not other.is_satisfiable:
-            return False
-
-        s = self
-        s_r = self.refinement_rules
-        s_a = self.adjacency_rules
-        s_m = self.mutex_rules
-        o = other
-        other.refinement_rules
-        other.adjacency_rules
-        other.mutex_rules
-        #
-        # print(f"sPHI:\n{s}")
-        # print(f"sEXT:\n{s_r}")
-        # print(f"sADJ:\n{s_a}")
-        # print(f"sMTX:\n{s_m}")
-        # print(f"oPHI:\n{o}")
-        # print(f"oEXT:\n{o_r}")
-        # print(f"oADJ:\n{o_a}")
-        # print(f"oMTX:\n{o_m}")
-
-        # new_f = (s_r & s_a & s_m & s) >> o
-        # new_f = (s_r & s_a & s_m & s) >> (o_r & o_a & o_m & o)
-        # new_f = (s_r & s_a & s_m & o_m & o_a & o_r) >> s >> o
-
-        # new_f = (s_r & s_a & s_m & o_m & o_a & o_r & s) >> o
-        # new_f = (s_r & s_a & s_m & o_m & o_a & s) >> o
-        new_f = (s_r & s_a & s_m & s) >> o
-
-        # new_f = (s_r & s_a & s_m & o_m & o_a & o_r & s) >> o
-        # new_f = (s_r & s_a & s_m & s) >> o
-        # new_f = (s_r & s_a & s_m & s) >> o
-
-        # new_f = s_r >> s >> o
-        # new_f = (((s_r & s_m) & (o_r & o_m) & s) >> o)
-
-        # new_f = ((s_r & s_m & s) >> o)
-        #
-        # new_f = (((s_r & s_m) >> s) >> ((s_r & s_m) >> o))
-
-        # new_f = (self.refinement_rules & self.adjacency_and_mutex_rules) >> other
-
-        return new_f.is_valid
+    def _store_refinement(self, other: LTL, verdict: Verdict) -> Verdict:
+        """Memo of self <= other, keyed by the key of other: it covers the
+        rules of other (its mutex groups, adjacency sets and refinements),
+        the key of self and its rules are fixed by self."""
+        if verdict.is_known:
+            self._refinements[other.key] = verdict
+        return verdict
 
     def __gt__(self, other: LTL):
         """self > other.
 
         True if self is an abstraction but not equal to other
         """
-        return self.__ge__(other) and self.__ne__(other)
+        return Verdict.of(self.__ge__(other)) & self.__ne__(other)
 
     def __ge__(self, other: LTL):
         """self >= other.
@@ -464,45 +613,97 @@ class LTL(Specification):
         True if self is an abstraction of other
         """
         """Check if (other -> self) is valid"""
-        return (other >> self).is_valid
+        return (other >> self).check_validity()
 
     def __eq__(self, other: object):
         """Check if self == other."""
         if not isinstance(other, LTL):
             return NotImplemented
         if str(self) == str(other):
-            return True
+            return Verdict.TRUE
         else:
             not_self = ~self
             if str(not_self) == str(other):
-                return False
-            return self.__le__(other) and self.__ge__(other)
+                return Verdict.FALSE
+            if self._refinements.get(other.key) is Verdict.FALSE:
+                return Verdict.FALSE
+            """Refinement in both directions, the missing checks run in one
+            batch"""
+            results = _check_all(
+                [
+                    (self, CheckType.SATISFIABILITY),
+                    (other, CheckType.SATISFIABILITY),
+                    (self._refinement_formula(other), CheckType.VALIDITY),
+                    (other >> self, CheckType.VALIDITY),
+                ]
+            )
+            self._store_refinement(other, Verdict.all(results[:3]))
+            return Verdict.all(results)
 
     def __ne__(self, other: object):
         """Check if self != other."""
         if not isinstance(other, LTL):
             return NotImplemented
-        return not self.__eq__(other)
+        return ~Verdict.of(self.__eq__(other))
 
     def __getstate__(self):
-        state = self.__dict__.copy()
-        del state["_tree"]
-        state["_expression"] = str(self.expression)
-        state["_boolean"] = str(self.boolean)
-        state["_boolean_typeset"] = self.boolean.typeset
-
-        return state
+        """Compact state: the formula, the types, the kind and the known
+        verdicts. The tree, the boolean abstraction and the rules are
+        rebuilt on demand."""
+        return {
+            "formula": self.formula,
+            "typeset": self.typeset,
+            "kind": self.kind,
+            "verdicts": self._verdicts,
+        }
 
     def __setstate__(self, state):
-        expression = state["_expression"]
-        boolean = state["_boolean"]
-        boolean_typeset = state["_boolean_typeset"]
-        del state["_expression"]
-        del state["_boolean"]
-        del state["_boolean_typeset"]
-        self.__dict__.update(state)
-        init_formula = expression
-        boolean = Bool(_init_formula=boolean, _typeset=boolean_typeset)
-        object.__setattr__(self, "_init_formula", init_formula)
-        object.__setattr__(self, "_boolean", boolean)
-        self.__post_init__()  # type: ignore
+        """Nothing is parsed here, the formula is parsed by spot the first
+        time the expression is needed. Unpickled objects are not
+        interned."""
+        object.__setattr__(self, "_init_formula", state["formula"])
+        object.__setattr__(self, "_typeset", state["typeset"])
+        object.__setattr__(self, "_boolean", None)
+        object.__setattr__(self, "_kind", state["kind"])
+        object.__setattr__(self, "_expression", None)
+        object.__setattr__(self, "_tree", None)
+        object.__setattr__(self, "_parse_env_systems", False)
+        object.__setattr__(self, "_rules", {})
+        object.__setattr__(self, "_verdicts", dict(state["verdicts"]))
+        object.__setattr__(self, "_refinements", {})
+        object.__setattr__(self, "_cnf", None)
+        object.__setattr__(self, "_dnf", None)
+
+
+def _check_all(checks: list[tuple[LTL, CheckType]]) -> list[Verdict]:
+    """Satisfiability (under the rules) or validity of each LTL.
+
+    The verdicts already known by the LTL objects are reused, the others
+    are checked in one batch and stored in the objects.
+    """
+    known: dict[int, Verdict] = {}
+    to_check = []
+    for i, (spec, check_type) in enumerate(checks):
+        if check_type in spec._verdicts:
+            known[i] = spec._verdicts[check_type]
+        else:
+            to_check.append(i)
+    if len(to_check) == 0:
+        return [known[i] for i in range(len(checks))]
+
+    formulas = []
+    for i in to_check:
+        spec, check_type = checks[i]
+        if check_type == CheckType.SATISFIABILITY:
+            formulas.append(spec._satisfiability_formula)
+        else:
+            formulas.append(spec)
+    typeset = Typeset.from_typesets(f.typeset for f in formulas)
+    verdicts = check_batch(
+        [(str(f), checks[i][1]) for i, f in zip(to_check, formulas)],
+        typeset.to_str_nuxmv(),
+    )
+    for i, verdict in zip(to_check, verdicts):
+        spec, check_type = checks[i]
+        known[i] = spec._store_verdict(check_type, verdict)
+    return [known[i] for i in range(len(checks))]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from crome_logic.specification.temporal import LTL
+from crome_logic.tools.verdict import Verdict
+
+
+@dataclass
+class RefinementLattice:
+    """Refinement order among specifications, identified by their index in
+    'specs'.
+
+    refines[i]: indices j such that specs[i] <= specs[j] (i excluded)
+    equivalent: classes of specifications refining each other
+    hasse: covering pairs (i, j) of the order among the classes, i and j
+        are the smallest index of their class
+    unknown: pairs whose check ran out of time or memory, or that involve a
+        specification whose satisfiability check did
+    unsatisfiable: specifications that refine nothing and nothing refines
+    n_checked / n_inferred: pairs decided by the solver / without it
+    """
+
+    specs: list[LTL]
+    refines: list[set[int]]
+    equivalent: list[set[int]] = field(default_factory=list)
+    hasse: set[tuple[int, int]] = field(default_factory=set)
+    unknown: set[tuple[int, int]] = field(default_factory=set)
+    unsatisfiable: set[int] = field(default_factory=set)
+    n_checked: int = 0
+    n_inferred: int = 0
+
+    def __str__(self):
+        ret = ""
+        for i, j in sorted(self.hasse):
+            ret += f"{self.specs[i]}\t<=\t{self.specs[j]}\n"
+        return ret[:-1]
+
+
+def build_refinement_lattice(
+    specs: Iterable[LTL],
+    max_workers: int | None = None,
+    transitivity: bool = True,
+) -> RefinementLattice:
+    """Computes the refinement order among the specifications and its Hasse
+    diagram.
+
+    The pairs are decided, in order of preference, by syntactic
+    shortcuts (same formula, other side trivially true), by transitivity
+    and by the solver. Solver checks run in waves of parallel calls, the
+    verdicts of each wave are propagated before the next one.
+    Transitivity assumes that the specifications share their rules
+    (e.g. the same typeset); set 'transitivity' to False otherwise.
+    """
+    specs = list(specs)
+    n = len(specs)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    up: list[set[int]] = [set() for _ in range(n)]
+    not_up: list[set[int]] = [set() for _ in range(n)]
+    lattice = RefinementLattice(specs=specs, refines=up)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        """Satisfiability of every specification, each one is checked once"""
+        satisfiable = list(executor.map(lambda s: s.check_satisfiability(), specs))
+        for i, verdict in enumerate(satisfiable):
+            if verdict is Verdict.FALSE:
+                lattice.unsatisfiable.add(i)
+
+        undecided = []
+        for i in range(n):
+            for j in range(n):
+                if i == j:
+                    continue
+                if i in lattice.unsatisfiable or j in lattice.unsatisfiable:
+                    not_up[i].add(j)
+                elif not (satisfiable[i].is_known and satisfiable[j].is_known):
+                    """Not checked, only transitivity can decide them"""
+                    lattice.unknown.add((i, j))
+                elif _trivially_refines(specs[i], specs[j]):
+                    up[i].add(j)
+                else:
+                    undecided.append((i, j))
+        lattice.n_inferred += n * (n - 1) - len(undecided) - len(lattice.unknown)
+
+        wave_size = 2 * max_workers
+        while len(undecided) > 0:
+            if transitivity:
+                _close(up, not_up)
+            pending = []
+            for i, j in undecided:
+                if j in up[i] or j in not_up[i]:
+                    lattice.n_inferred += 1
+                else:
+                    pending.append((i, j))
+            wave, undecided = pending[:wave_size], pending[wave_size:]
+            verdicts = executor.map(lambda p: specs[p[0]] <= specs[p[1]], wave)
+            for (i, j), verdict in zip(wave, verdicts):
+                lattice.n_checked += 1
+                if verdict is Verdict.TRUE:
+                    up[i].add(j)
+                elif verdict is Verdict.FALSE:
+                    not_up[i].add(j)
+                else:
+                    lattice.unknown.add((i, j))
+    if transitivity:
+        _close(up, not_up)
+    lattice.unknown = {
+        (i, j) for i, j in lattice.unknown if j not in up[i] and j not in not_up[i]
+    }
+
+    _hasse(lattice)
+    return lattice
+
+
+def _trivially_refines(spec: LTL, other: LTL) -> bool:
+    """Both sides are satisfiable."""
+    if spec is other or str(spec) == str(other):
+        return True
+    return other.is_true_expression
+
+
+def _close(up: list[set[int]], not_up: list[set[int]]):
+    """Propagates the known verdicts: i <= k <= j implies i <= j, while
+    i <= k and not i <= j imply not k <= j (and symmetrically)."""
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(up)):
+            closure = set(up[i])
+            for k in up[i]:
+                closure |= up[k]
+            closure.discard(i)
+            if closure != up[i]:
+                up[i] |= closure
+                changed = True
+        down: list[set[int]] = [set() for _ in range(len(up))]
+        for i, above in enumerate(up):
+            for j in above:
+                down[j].add(i)
+        for i in range(len(up)):
+            for j in list(not_up[i]):
+                for k in up[i]:
+                    if j not in not_up[k] and j != k:
+                        not_up[k].add(j)
+                        changed = True
+                for k in down[j]:
+                    if k not in not_up[i] and k != i:
+                        not_up[i].add(k)
+                        changed = True
+
+
+def _hasse(lattice: RefinementLattice):
+    up = lattice.refines
+    representative: dict[int, int] = {}
+    for i in range(len(up)):
+        if i in representative:
+            continue
+        equivalent = {i} | {j for j in up[i] if i in up[j]}
+        lattice.equivalent.append(equivalent)
+        for j in equivalent:
+            representative[j] = i
+    above = {}
+    for i in set(representative.values()):
+        above[i] = {representative[j] for j in up[i]} - {i}
+    for i, above_i in above.items():
+        for j in above_i:
+            """j covers i if no class lies strictly between them"""
+            if not any(j in above[k] for k in above_i if k != j):
+                lattice.hasse.add((i, j))
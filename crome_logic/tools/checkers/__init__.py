@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+from crome_logic.tools.atomic_propositions import extract_ap
+from crome_logic.tools.checkers import propositional
+from crome_logic.tools.nuxmv import CheckType, decided
+from crome_logic.tools.verdict import Verdict
+
+
+class Checker(ABC):
+    """Base class of the backends deciding LTL satisfiability and
+    validity.
+
+    Expressions are in spot syntax, 'aps' are the variable declarations
+    in nuXmv syntax (e.g. 'a: boolean'). Backends may return plain
+    booleans, or Verdict.UNKNOWN when they give up on a check.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def check_satisfiability(self, expression: str, aps: list[str]) -> Verdict:
+        pass
+
+    @abstractmethod
+    def check_validity(self, expression: str, aps: list[str]) -> Verdict:
+        pass
+
+    def supports(self, expression: str, aps: list[str]) -> bool:
+        """True if the backend can decide checks on the expression."""
+        return True
+
+    def check_batch(
+        self, checks: list[tuple[str, CheckType]], aps: list[str]
+    ) -> list[Verdict]:
+        results = []
+        for expression, check_type in checks:
+            if check_type == CheckType.SATISFIABILITY:
+                results.append(self.check_satisfiability(expression, aps))
+            elif check_type == CheckType.VALIDITY:
+                results.append(self.check_validity(expression, aps))
+            else:
+                raise Exception("Type of checking not supported")
+        return results
+
+    async def check_batch_async(
+        self, checks: list[tuple[str, CheckType]], aps: list[str]
+    ) -> list[Verdict]:
+        """Runs check_batch in a thread, backends with non-blocking I/O
+        override it."""
+        return await asyncio.to_thread(self.check_batch, checks, aps)
+
+
+@dataclass
+class CheckerSettings:
+    """Selection of the checker.
+
+    default: name of the checker used when none is given. 'nuxmv' goes
+        through the pool, the persistent cache, the limits and keeps the
+        traces; 'auto' (opt-in) uses spot for formulas with at most
+        'spot_max_size' nodes, which are neither cached nor traced
+    spot_max_size: size of the largest formula decided by spot in 'auto' mode
+    propositional_fast_path: decide formulas without temporal operators with
+        pyeda, without calling any checker
+    """
+
+    default: str = "nuxmv"
+    spot_max_size: int = 100
+    propositional_fast_path: bool = True
+
+
+@dataclass
+class CheckStatistics:
+    """Number of checks decided by the propositional fast path and by each
+    checker."""
+
+    fast_path: int = 0
+    checkers: dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def count(self, name: str | None = None, n: int = 1):
+        with self._lock:
+            if name is None:
+                self.fast_path += n
+            else:
+                self.checkers[name] = self.checkers.get(name, 0) + n
+
+    @property
+    def total(self) -> int:
+        return self.fast_path + sum(self.checkers.values())
+
+    def reset(self):
+        with self._lock:
+            self.fast_path = 0
+            self.checkers = {}
+
+    def __str__(self):
+        ret = f"fast path:\t{self.fast_path}\n"
+        for name, n in self.checkers.items():
+            ret += f"{name}:\t{n}\n"
+        return ret[:-1]
+
+
+settings = CheckerSettings()
+statistics = CheckStatistics()
+_checkers: dict[str, Checker] = {}
+
+
+def register_checker(checker: Checker) -> None:
+    _checkers[checker.name] = checker
+
+
+def _register_default_checkers() -> None:
+    from crome_logic.tools.checkers.auto_checker import AutoChecker
+    from crome_logic.tools.checkers.nuxmv_checker import NuxmvChecker
+    from crome_logic.tools.checkers.spot_checker import SpotChecker
+
+    for checker in [NuxmvChecker(), SpotChecker(), AutoChecker()]:
+        if checker.name not in _checkers:
+            register_checker(checker)
+
+
+def get_checker(checker: Checker | str | None = None) -> Checker:
+    if isinstance(checker, Checker):
+        return checker
+    if checker is None:
+        checker = settings.default
+    if checker not in _checkers:
+        _register_default_checkers()
+    if checker not in _checkers:
+        raise Exception(f"Checker '{checker}' unknown, use one of {list(_checkers)}")
+    return _checkers[checker]
+
+
+def set_default_checker(checker: Checker | str):
+    if isinstance(checker, Checker):
+        register_checker(checker)
+        checker = checker.name
+    get_checker(checker)
+    settings.default = checker
+
+
+def boolean_variables(aps: list[str]) -> set[str]:
+    """Names of the boolean variables among the declarations."""
+    variables = set()
+    for declaration in aps:
+        name, _, var_type = declaration.partition(":")
+        if var_type.strip() == "boolean":
+            variables.add(name.strip())
+    return variables
+
+
+def _takes_fast_path(expression: str, aps: list[str]) -> bool:
+    if not settings.propositional_fast_path:
+        return False
+    if not propositional.is_propositional(expression):
+        return False
+    """Atoms such as 'x > 3' are not independent propositions"""
+    return extract_ap(expression) <= boolean_variables(aps)
+
+
+def check_satisfiability(
+    expression: str, aps: list[str], checker: Checker | str | None = None
+) -> Verdict:
+    return check_batch([(expression, CheckType.SATISFIABILITY)], aps, checker)[0]
+
+
+def check_validity(
+    expression: str, aps: list[str], checker: Checker | str | None = None
+) -> Verdict:
+    return check_batch([(expression, CheckType.VALIDITY)], aps, checker)[0]
+
+
+def check_batch(
+    checks: list[tuple[str, CheckType]],
+    aps: list[str],
+    checker: Checker | str | None = None,
+) -> list[Verdict]:
+    """Checks the formulas without temporal operators with pyeda and the
+    others with the checker."""
+    checker = get_checker(checker)
+    results, to_checker = _fast_path_batch(checks, aps)
+    if len(to_checker) > 0:
+        verdicts = checker.check_batch([checks[i] for i in to_checker], aps)
+        statistics.count(checker.name, len(to_checker))
+        for i, verdict in zip(to_checker, verdicts):
+            results[i] = Verdict.of(verdict)
+    return decided(results)
+
+
+async def check_satisfiability_async(
+    expression: str, aps: list[str], checker: Checker | str | None = None
+) -> Verdict:
+    checks = [(expression, CheckType.SATISFIABILITY)]
+    return (await check_batch_async(checks, aps, checker))[0]
+
+
+async def check_validity_async(
+    expression: str, aps: list[str], checker: Checker | str | None = None
+) -> Verdict:
+    checks = [(expression, CheckType.VALIDITY)]
+    return (await check_batch_async(checks, aps, checker))[0]
+
+
+async def check_batch_async(
+    checks: list[tuple[str, CheckType]],
+    aps: list[str],
+    checker: Checker | str | None = None,
+) -> list[Verdict]:
+    """Same as check_batch, without blocking the event loop: the fast path
+    (spot parsing and SAT solving) runs in a worker thread."""
+    checker = get_checker(checker)
+    results, to_checker = await asyncio.to_thread(_fast_path_batch, checks, aps)
+    if len(to_checker) > 0:
+        verdicts = await checker.check_batch_async([checks[i] for i in to_checker], aps)
+        statistics.count(checker.name, len(to_checker))
+        for i, verdict in zip(to_checker, verdicts):
+            results[i] = Verdict.of(verdict)
+    return decided(results)
+
+
+def _fast_path_batch(
+    checks: list[tuple[str, CheckType]], aps: list[str]
+) -> tuple[list[Verdict | None], list[int]]:
+    """Decides the checks that take the propositional fast path.
+
+    Returns the results and the indices of the checks left for the
+    checker.
+    """
+    results: list[Verdict | None] = [None] * len(checks)
+    to_checker = []
+    for i, (expression, check_type) in enumerate(checks):
+        if _takes_fast_path(expression, aps):
+            if check_type == CheckType.SATISFIABILITY:
+                results[i] = Verdict.of(propositional.check_satisfiability(expression))
+            elif check_type == CheckType.VALIDITY:
+                results[i] = Verdict.of(propositional.check_validity(expression))
+            else:
+                raise Exception("Type of checking not supported")
+            statistics.count()
+        else:
+            to_checker.append(i)
+    return results, to_checker
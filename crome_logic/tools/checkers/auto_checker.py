@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+
+from crome_logic.tools import checkers
+from crome_logic.tools.checkers import Checker, decided, get_checker
+from crome_logic.tools.checkers.spot_checker import formula_size
+from crome_logic.tools.nuxmv import CheckType
+from crome_logic.tools.verdict import Verdict
+
+
+class AutoChecker(Checker):
+    """Decides small boolean-variable formulas with spot, in-process, and
+    sends everything else to nuXmv."""
+
+    name = "auto"
+
+    def _select(self, expression: str, aps: list[str]) -> Checker:
+        spot_checker = get_checker("spot")
+        if spot_checker.supports(expression, aps):
+            if formula_size(expression) <= checkers.settings.spot_max_size:
+                return spot_checker
+        return get_checker("nuxmv")
+
+    def check_satisfiability(self, expression: str, aps: list[str]) -> Verdict:
+        return self._select(expression, aps).check_satisfiability(expression, aps)
+
+    def check_validity(self, expression: str, aps: list[str]) -> Verdict:
+        return self._select(expression, aps).check_validity(expression, aps)
+
+    def check_batch(
+        self, checks: list[tuple[str, CheckType]], aps: list[str]
+    ) -> list[Verdict]:
+        """Checks decided by spot run in-process, the others in one nuXmv
+        batch."""
+        results, to_nuxmv = self._spot_batch(checks, aps)
+        if len(to_nuxmv) > 0:
+            verdicts = get_checker("nuxmv").check_batch(
+                [checks[i] for i in to_nuxmv], aps
+            )
+            for i, verdict in zip(to_nuxmv, verdicts):
+                results[i] = verdict
+        return decided(results)
+
+    async def check_batch_async(
+        self, checks: list[tuple[str, CheckType]], aps: list[str]
+    ) -> list[Verdict]:
+        results, to_nuxmv = await asyncio.to_thread(self._spot_batch, checks, aps)
+        if len(to_nuxmv) > 0:
+            verdicts = await get_checker("nuxmv").check_batch_async(
+                [checks[i] for i in to_nuxmv], aps
+            )
+            for i, verdict in zip(to_nuxmv, verdicts):
+                results[i] = verdict
+        return decided(results)
+
+    def _spot_batch(
+        self, checks: list[tuple[str, CheckType]], aps: list[str]
+    ) -> tuple[list[Verdict | None], list[int]]:
+        """Decides the checks selected for spot, returns the results and the
+        indices of the checks left for nuXmv."""
+        results: list[Verdict | None] = [None] * len(checks)
+        to_nuxmv = []
+        for i, (expression, check_type) in enumerate(checks):
+            checker = self._select(expression, aps)
+            if checker.name == "nuxmv":
+                to_nuxmv.append(i)
+            else:
+                results[i] = Verdict.of(
+                    checker.check_batch([(expression, check_type)], aps)[0]
+                )
+        return results, to_nuxmv
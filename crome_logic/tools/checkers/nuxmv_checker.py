@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from crome_logic.tools import nuxmv
+from crome_logic.tools.checkers import Checker
+from crome_logic.tools.nuxmv import CheckType
+from crome_logic.tools.verdict import Verdict
+
+
+class NuxmvChecker(Checker):
+    """Runs the checks with nuXmv (pool, cache and docker fallback)."""
+
+    name = "nuxmv"
+
+    def check_satisfiability(self, expression: str, aps: list[str]) -> Verdict:
+        return nuxmv.check_satisfiability(expression, aps)
+
+    def check_validity(self, expression: str, aps: list[str]) -> Verdict:
+        return nuxmv.check_validity(expression, aps)
+
+    def check_batch(
+        self, checks: list[tuple[str, CheckType]], aps: list[str]
+    ) -> list[Verdict]:
+        return nuxmv.check_batch(checks, aps)
+
+    async def check_batch_async(
+        self, checks: list[tuple[str, CheckType]], aps: list[str]
+    ) -> list[Verdict]:
+        return await nuxmv.check_batch_async(checks, aps)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import spot
+from pyeda.boolalg.expr import (
+    And,
+    Equal,
+    Expression,
+    Implies,
+    Not,
+    Or,
+    Xor,
+    expr,
+    exprvar,
+)
+
+from crome_logic.specification.boolean.tseitin import is_satisfiable, is_valid
+
+
+def is_propositional(expression: str | spot.formula) -> bool:
+    """True if the formula has no temporal operator."""
+    if isinstance(expression, str):
+        expression = spot.formula(expression)
+    return expression.is_boolean()
+
+
+def spot_to_pyeda(
+    formula: spot.formula, variables: dict[str, Expression] | None = None
+) -> Expression:
+    """Converts a formula without temporal operators to a pyeda expression.
+
+    The atoms are mapped to the pyeda variables p[0], p[1], ... and
+    stored in 'variables'.
+    """
+    if variables is None:
+        variables = {}
+    if formula._is(spot.op_ap):
+        name = str(formula)
+        if name not in variables:
+            variables[name] = exprvar("p", len(variables))
+        return variables[name]
+    if formula._is(spot.op_tt):
+        return expr(1)
+    if formula._is(spot.op_ff):
+        return expr(0)
+    children = [spot_to_pyeda(f, variables) for f in formula]
+    if formula._is(spot.op_Not):
+        return Not(children[0])
+    if formula._is(spot.op_And):
+        return And(*children)
+    if formula._is(spot.op_Or):
+        return Or(*children)
+    if formula._is(spot.op_Implies):
+        return Implies(children[0], children[1])
+    if formula._is(spot.op_Equiv):
+        return Equal(children[0], children[1])
+    if formula._is(spot.op_Xor):
+        return Xor(children[0], children[1])
+    raise Exception(f"Operator not propositional: {formula.kindstr()}")
+
+
+def check_satisfiability(expression: str) -> bool:
+    """Decides a formula without temporal operators with pyeda: an LTL
+    formula without temporal operators only constrains the first state.
+    The SAT solver runs on the Tseitin CNF of the formula."""
+    return is_satisfiable(spot_to_pyeda(spot.formula(expression)))
+
+
+def check_validity(expression: str) -> bool:
+    return is_valid(spot_to_pyeda(spot.formula(expression)))
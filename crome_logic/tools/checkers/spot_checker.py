@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import multiprocessing
+from multiprocessing.connection import Connection
+
+import spot
+
+from crome_logic.specification.tools import is_false_string, is_true_string
+from crome_logic.tools import nuxmv
+from crome_logic.tools.atomic_propositions import extract_ap
+from crome_logic.tools.checkers import Checker, boolean_variables
+from crome_logic.tools.nuxmv.limits import set_memory_limit
+from crome_logic.tools.verdict import Verdict
+
+
+class SpotChecker(Checker):
+    """Decides the checks in-process: the formula is translated to a Büchi
+    automaton and checked for emptiness.
+
+    Only boolean variables are supported, spot would treat atoms such as
+    'x > 3' as independent propositions. The time and memory limits of
+    the nuXmv settings apply: with a timeout the translation runs in a
+    process that is killed when the time is up, the verdict is then
+    Verdict.UNKNOWN.
+    """
+
+    name = "spot"
+
+    def supports(self, expression: str, aps: list[str]) -> bool:
+        return extract_ap(expression) <= boolean_variables(aps)
+
+    def check_satisfiability(self, expression: str, aps: list[str]) -> Verdict:
+        if is_true_string(expression):
+            return Verdict.TRUE
+        if is_false_string(expression):
+            return Verdict.FALSE
+        if not self.supports(expression, aps):
+            raise Exception("The spot checker only supports boolean variables")
+        return ~_is_empty(expression, negate=False)
+
+    def check_validity(self, expression: str, aps: list[str]) -> Verdict:
+        if is_true_string(expression):
+            return Verdict.TRUE
+        if is_false_string(expression):
+            return Verdict.FALSE
+        if not self.supports(expression, aps):
+            raise Exception("The spot checker only supports boolean variables")
+        return _is_empty(expression, negate=True)
+
+
+def _is_empty(expression: str, negate: bool) -> Verdict:
+    """Emptiness of the Büchi automaton of the expression (or of its
+    negation), decided within the limits of the nuXmv settings."""
+    timeout = nuxmv.settings.timeout
+    memory_limit = nuxmv.settings.memory_limit
+    if timeout is None and memory_limit is None:
+        return Verdict.of(_translate_is_empty(expression, negate))
+    """The fork server starts the processes from a process without threads"""
+    context = multiprocessing.get_context("forkserver")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_worker, args=(expression, negate, memory_limit, sender), daemon=True
+    )
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            return Verdict.UNKNOWN
+        return Verdict.of(receiver.recv())
+    except EOFError:
+        """The process died, e.g. it ran out of memory"""
+        return Verdict.UNKNOWN
+    finally:
+        receiver.close()
+        process.kill()
+        process.join()
+
+
+def _worker(
+    expression: str, negate: bool, memory_limit: int | None, sender: Connection
+) -> None:
+    """Runs in the background processes, the verdict travels as a bool."""
+    set_memory_limit(memory_limit)
+    sender.send(_translate_is_empty(expression, negate))
+    sender.close()
+
+
+def _translate_is_empty(expression: str, negate: bool) -> bool:
+    formula = spot.formula(expression)
+    if negate:
+        formula = spot.formula.Not(formula)
+    return spot.translate(formula, "Buchi", "low").is_empty()
+
+
+def formula_size(expression: str | spot.formula) -> int:
+    """Number of nodes of the syntax tree of the formula."""
+    if isinstance(expression, str):
+        expression = spot.formula(expression)
+    size = 0
+
+    def count(_) -> bool:
+        nonlocal size
+        size += 1
+        return False
+
+    expression.traverse(count)
+    return size
@@ -0,0 +1,615 @@
+import asyncio
+import atexit
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import List
+from weakref import WeakKeyDictionary
+
+import docker
+
+from crome_logic.specification.string_logic import not_
+from crome_logic.specification.tools import is_false_string, is_true_string
+from crome_logic.tools.nuxmv.cache import ResultCache
+from crome_logic.tools.nuxmv.canonical import canonical_key
+from crome_logic.tools.nuxmv.container import NuxmvContainer
+from crome_logic.tools.nuxmv.limits import (
+    ResourceLimitExceeded,
+    limit_exceeded,
+    limited_command,
+)
+from crome_logic.tools.nuxmv.pool import NuxmvPool
+from crome_logic.tools.nuxmv.trace import Trace, parse_trace
+from crome_logic.tools.string_manipulation import add_spaces_spot_ltl
+from crome_logic.tools.verdict import Verdict
+
+
+class CheckType(Enum):
+    SATISFIABILITY = 0
+    VALIDITY = 1
+
+
+@dataclass
+class NuxmvSettings:
+    """Configuration of the nuXmv backend.
+
+    use_pool: check models with a pool of long-lived interactive nuXmv processes
+    pool_size: maximum number of nuXmv processes running at the same time (also
+        bounds the asyncio subprocesses of each event loop)
+    use_cache: store the verdicts in a persistent cache shared across processes
+    cache_path: SQLite file of the cache
+    cache_max_entries: number of verdicts kept in the cache (LRU eviction)
+    canonical_keys: simplify and sort the expressions before looking them up
+    rename_atoms: also rename the atoms, so formulas equal up to renaming match
+    docker_image: image providing nuXmv when it is not on the PATH
+    reuse_container: keep one container alive and exec each check in it
+    timeout: wall-clock seconds allowed to each check (also by the spot checker),
+        None for no limit
+    memory_limit: MB of memory allowed to each nuXmv (or spot) process, None for
+        no limit
+    max_traces: number of counterexample traces kept in memory (LRU eviction)
+    """
+
+    use_pool: bool = True
+    pool_size: int = os.cpu_count() or 1
+    use_cache: bool = True
+    cache_path: Path | None = None
+    cache_max_entries: int = 100000
+    canonical_keys: bool = True
+    rename_atoms: bool = False
+    docker_image: str = "pmallozzi/ltltools"
+    reuse_container: bool = True
+    timeout: float | None = None
+    memory_limit: int | None = None
+    max_traces: int = 256
+
+
+output_folder = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "output")
+)
+
+if not os.path.exists(output_folder):
+    os.makedirs(output_folder)
+
+folder_path = Path(output_folder)
+
+settings = NuxmvSettings(cache_path=folder_path / "persistence" / "nuxmv_cache.sqlite")
+_pool: NuxmvPool | None = None
+_cache: ResultCache | None = None
+_container: NuxmvContainer | None = None
+
+_semaphores: WeakKeyDictionary = WeakKeyDictionary()
+_traces: OrderedDict[tuple, Trace] = OrderedDict()
+
+_pool_lock = threading.Lock()
+_cache_lock = threading.Lock()
+_container_lock = threading.Lock()
+_traces_lock = threading.Lock()
+
+
+def get_cache() -> ResultCache:
+    global _cache
+    with _cache_lock:
+        path = settings.cache_path
+        if path is None:
+            raise Exception("settings.cache_path is needed by the cache")
+        if _cache is None or _cache.path != Path(path):
+            if _cache is not None:
+                _cache.flush()
+            _cache = ResultCache(path=path, max_entries=settings.cache_max_entries)
+        _cache.max_entries = settings.cache_max_entries
+    return _cache
+
+
+def get_pool() -> NuxmvPool:
+    """A pool replaced after a settings change is retired: the threads
+    using it finish their checks before its workers are closed."""
+    global _pool
+    with _pool_lock:
+        if (
+            _pool is None
+            or _pool.size != settings.pool_size
+            or _pool.memory_limit != settings.memory_limit
+        ):
+            if _pool is not None:
+                _pool.retire()
+            _pool = NuxmvPool(
+                size=settings.pool_size, memory_limit=settings.memory_limit
+            )
+        return _pool
+
+
+def set_pool_size(size: int) -> None:
+    settings.pool_size = size
+    get_pool()
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def get_container() -> NuxmvContainer:
+    global _container
+    with _container_lock:
+        if _container is None or _container.image != settings.docker_image:
+            if _container is not None:
+                _container.stop()
+            _container = NuxmvContainer(image=settings.docker_image)
+    return _container
+
+
+def shutdown_container():
+    global _container
+    with _container_lock:
+        if _container is not None:
+            _container.stop()
+            _container = None
+
+
+def flush_cache() -> None:
+    """Writes the recency of the cache hits not yet recorded in the file."""
+    with _cache_lock:
+        if _cache is not None:
+            _cache.flush()
+
+
+atexit.register(shutdown_pool)
+atexit.register(shutdown_container)
+atexit.register(flush_cache)
+
+
+def check_satisfiability(expression: str, aps: list[str]) -> Verdict:
+    return check_batch([(expression, CheckType.SATISFIABILITY)], aps)[0]
+
+
+def check_validity(expression: str, aps: list[str]) -> Verdict:
+    return check_batch([(expression, CheckType.VALIDITY)], aps)[0]
+
+
+def check_batch(checks: list[tuple[str, CheckType]], aps: list[str]) -> list[Verdict]:
+    """Checks all the (expression, check type) pairs over the same variables
+    with a single nuXmv run, one LTLSPEC per check.
+
+    Returns the verdicts in the same order as 'checks', Verdict.UNKNOWN
+    for the checks that nuXmv could not finish within the limits.
+    """
+    results, keys, to_check = _lookup_batch(checks, aps)
+    if len(to_check) > 0:
+        model_path = _write_batch(checks, to_check, aps)
+        try:
+            output = _launch_nuxmv(model_path, _timeout(len(to_check)))
+            complete = True
+        except ResourceLimitExceeded as e:
+            output = _clean_output(e.output)
+            complete = False
+        _store_batch(checks, aps, to_check, keys, output, results, complete)
+    return decided(results)
+
+
+async def check_batch_async(
+    checks: list[tuple[str, CheckType]], aps: list[str]
+) -> list[Verdict]:
+    """Same as check_batch, nuXmv runs as an asyncio subprocess.
+
+    At most settings.pool_size nuXmv processes run at the same time for
+    each event loop. The cache lookups, the canonical keys and the model
+    file (SQLite, spot and disk I/O) are handled in worker threads, not on
+    the event loop.
+    """
+    results, keys, to_check = await asyncio.to_thread(_lookup_batch, checks, aps)
+    if len(to_check) > 0:
+        model_path = await asyncio.to_thread(_write_batch, checks, to_check, aps)
+        try:
+            output = await _launch_nuxmv_async(model_path, _timeout(len(to_check)))
+            complete = True
+        except ResourceLimitExceeded as e:
+            output = _clean_output(e.output)
+            complete = False
+        await asyncio.to_thread(
+            _store_batch, checks, aps, to_check, keys, output, results, complete
+        )
+    return decided(results)
+
+
+def get_trace(
+    expression: str, aps: list[str], check_type: CheckType = CheckType.VALIDITY
+) -> Trace | None:
+    """Trace explaining the verdict of a check: a counterexample if the
+    expression is not valid, a witness if it is satisfiable.
+
+    The traces printed by nuXmv are kept when the verdict is computed,
+    the check is run again (bypassing the verdict cache) only if the
+    trace is not in memory. Returns None if there is no trace, e.g. the
+    expression is valid, or nuXmv exceeded its limits, and raises an
+    exception if nuXmv did not report the specification.
+    """
+    key = _trace_key(expression, aps, check_type)
+    with _traces_lock:
+        if key in _traces:
+            _traces.move_to_end(key)
+            return _traces[key]
+    if is_true_string(expression) or is_false_string(expression):
+        return None
+    model_path = _write_file(aps, [(expression, check_type)])
+    try:
+        output = _launch_nuxmv(model_path, _timeout(1))
+    except ResourceLimitExceeded:
+        return None
+    traces = _parse_traces(output)
+    if len(traces) == 0:
+        """nuXmv finished without reporting the specification"""
+        raise Exception("nuXmv produced something unexpected")
+    trace = traces[0]
+    _store_trace(key, trace)
+    return trace
+
+
+async def check_satisfiability_async(expression: str, aps: list[str]) -> Verdict:
+    return (await check_batch_async([(expression, CheckType.SATISFIABILITY)], aps))[0]
+
+
+async def check_validity_async(expression: str, aps: list[str]) -> Verdict:
+    return (await check_batch_async([(expression, CheckType.VALIDITY)], aps))[0]
+
+
+def decided(results: list[Verdict | None]) -> list[Verdict]:
+    """Narrows the results of a batch once every check has a verdict."""
+    verdicts = []
+    for verdict in results:
+        if verdict is None:
+            raise Exception("A check of the batch has no verdict")
+        verdicts.append(verdict)
+    return verdicts
+
+
+def _lookup_batch(
+    checks: list[tuple[str, CheckType]], aps: list[str]
+) -> tuple[list[Verdict | None], list[str | None], list[int]]:
+    """Solves the trivial and cached checks.
+
+    Returns the results, the cache keys and the indices of the checks
+    left for nuXmv.
+    """
+    results: list[Verdict | None] = [None] * len(checks)
+    keys: list[str | None] = [None] * len(checks)
+    to_check: list[int] = []
+
+    for i, (expression, check_type) in enumerate(checks):
+        if is_true_string(expression):
+            results[i] = Verdict.TRUE
+            continue
+        if is_false_string(expression):
+            results[i] = Verdict.FALSE
+            continue
+        if settings.use_cache:
+            key = _cache_key(expression, aps, check_type)
+            keys[i] = key
+            result = get_cache().get(key)
+            if result is not None:
+                answer = "YES" if result else "NO"
+                label = _label(check_type)
+                print(f"\t\t\t{label}-SKIPPED ({answer}):\t{expression}")
+                results[i] = Verdict.of(result)
+                continue
+        to_check.append(i)
+    return results, keys, to_check
+
+
+def _write_batch(
+    checks: list[tuple[str, CheckType]], to_check: list[int], aps: list[str]
+) -> Path:
+    specs = [checks[i] for i in to_check]
+    for expression, check_type in specs:
+        print(f"\t\t\tChecking {_label(check_type)}:\t\t{expression}")
+    return _write_file(aps, specs)
+
+
+def _store_batch(
+    checks: list[tuple[str, CheckType]],
+    aps: list[str],
+    to_check: list[int],
+    keys: list[str | None],
+    output: list[str],
+    results: list[Verdict | None],
+    complete: bool = True,
+):
+    verdicts = _parse_outputs(output, [checks[i][1] for i in to_check], complete)
+    for i, verdict in zip(to_check, verdicts):
+        results[i] = verdict
+        """Only definitive verdicts are cached"""
+        key = keys[i]
+        if key is not None and verdict.is_known:
+            get_cache().put(key, bool(verdict))
+    """The traces come from the same run, they cost no extra process"""
+    for i, trace in zip(to_check, _parse_traces(output, complete)):
+        expression, check_type = checks[i]
+        _store_trace(_trace_key(expression, aps, check_type), trace)
+
+
+def _trace_key(expression: str, aps: list[str], check_type: CheckType) -> tuple:
+    """The order of the variables depends on the typesets and on the batch,
+    it does not change the trace."""
+    return check_type, expression, frozenset(aps)
+
+
+def _store_trace(key: tuple, trace: Trace | None):
+    if trace is None:
+        return
+    with _traces_lock:
+        _traces[key] = trace
+        _traces.move_to_end(key)
+        while len(_traces) > settings.max_traces:
+            _traces.popitem(last=False)
+
+
+def _timeout(n_checks: int) -> float | None:
+    """The timeout applies to each check, a batch gets one per LTLSPEC."""
+    if settings.timeout is None:
+        return None
+    return settings.timeout * n_checks
+
+
+def _label(check_type: CheckType) -> str:
+    if check_type == CheckType.SATISFIABILITY:
+        return "SAT"
+    elif check_type == CheckType.VALIDITY:
+        return "VAL"
+    raise Exception("Type of checking not supported")
+
+
+def _cache_key(expression: str, aps: list[str], check_type: CheckType) -> str:
+    if settings.canonical_keys:
+        expression, variables = canonical_key(
+            expression, tuple(aps), settings.rename_atoms
+        )
+    else:
+        expression, variables = " ".join(expression.split()), tuple(aps)
+    return ResultCache.make_key(check_type.name, expression, list(variables))
+
+
+def _write_file(variables: List[str], specs: list[tuple[str, CheckType]]) -> Path:
+    """Writes the model in a new file, so that concurrent checks do not
+    interfere.
+
+    Each (expression, check type) pair becomes an LTLSPEC, in order.
+    """
+    file_descriptor, file_name = tempfile.mkstemp(
+        prefix="nusmvfile_", suffix=".smv", dir=folder_path
+    )
+    with os.fdopen(file_descriptor, "w") as ofile:
+        ofile.write("MODULE main\n")
+        ofile.write("VAR\n")
+        for v in list(set(variables)):
+            ofile.write(f"\t{v};\n")
+        ofile.write("\n")
+        for expression, check_type in specs:
+            expression = add_spaces_spot_ltl(expression)
+            ofile.write("LTLSPEC ")
+            if check_type == CheckType.SATISFIABILITY:
+                ofile.write(str(not_(expression)))
+            elif check_type == CheckType.VALIDITY:
+                ofile.write(str(expression))
+            else:
+                raise Exception("Type of checking not supported")
+            ofile.write("\n")
+    return Path(file_name)
+
+
+def _parse_output(output: List[str], check_type: CheckType) -> Verdict:
+    return _parse_outputs(output, [check_type])[0]
+
+
+def _parse_outputs(
+    output: List[str], check_types: list[CheckType], complete: bool = True
+) -> list[Verdict]:
+    """Maps the '-- specification ... is true/false' lines to the checks,
+    nuXmv reports them in the order of the LTLSPEC.
+
+    If the output is not complete (nuXmv was stopped), the checks
+    without a line are UNKNOWN.
+    """
+    results: list[Verdict] = []
+    for line in output:
+        if line[:16] == "-- specification":
+            if len(results) == len(check_types):
+                raise Exception("nuXmv produced something unexpected")
+            check_type = check_types[len(results)]
+            spec = line[16:].rpartition(" is ")[0]
+            if "is false" in line:
+                if check_type == CheckType.SATISFIABILITY:
+                    print("\t\t\tSAT-YES:\t" + spec)
+                    results.append(Verdict.TRUE)
+                elif check_type == CheckType.VALIDITY:
+                    print("\t\t\tVAL-NO :\t" + spec)
+                    results.append(Verdict.FALSE)
+                else:
+                    raise Exception("Type of checking not supported")
+            elif "is true" in line:
+                if check_type == CheckType.SATISFIABILITY:
+                    print("\t\t\tSAT-NO :\t" + spec)
+                    results.append(Verdict.FALSE)
+                elif check_type == CheckType.VALIDITY:
+                    print("\t\t\tVAL-YES:\t" + spec)
+                    results.append(Verdict.TRUE)
+                else:
+                    raise Exception("Type of checking not supported")
+            else:
+                raise Exception("nuXmv produced something unexpected")
+    if len(results) != len(check_types):
+        if complete:
+            raise Exception("nuXmv produced something unexpected")
+        for check_type in check_types[len(results) :]:
+            print(f"\t\t\t{_label(check_type)}-UNKNOWN (limit exceeded)")
+            results.append(Verdict.UNKNOWN)
+    return results
+
+
+def _parse_traces(output: List[str], complete: bool = True) -> list[Trace | None]:
+    """One entry per '-- specification' line, the trace printed after
+    the line if the specification is false.
+
+    If the output is not complete (nuXmv was stopped), the last trace
+    may be truncated: it is kept only if another '-- specification'
+    line follows it.
+    """
+    traces = []
+    trace_lines: list[str] | None = None
+    for line in output:
+        if line[:16] == "-- specification":
+            if trace_lines is not None:
+                traces.append(parse_trace(trace_lines))
+            trace_lines = [] if "is false" in line else None
+            if trace_lines is None:
+                traces.append(None)
+        elif trace_lines is not None:
+            trace_lines.append(line)
+    if trace_lines is not None:
+        traces.append(parse_trace(trace_lines) if complete else None)
+    return traces
+
+
+def _launch_nuxmv(model_path: Path, timeout: float | None = None) -> List[str]:
+    """Runs nuXmv on the model and removes it.
+
+    Raises ResourceLimitExceeded if nuXmv runs out of time or memory.
+    """
+    # print("Launching nuXmv....")
+    try:
+        if shutil.which("nuXmv") is not None:
+            if settings.use_pool:
+                output = get_pool().check(model_path, timeout)
+            else:
+                output = _run_nuxmv(model_path, timeout)
+        elif settings.reuse_container:
+            output = get_container().check(
+                model_path.read_text(), timeout, settings.memory_limit
+            )
+        else:
+            output = _run_docker(model_path, timeout)
+    finally:
+        model_path.unlink(missing_ok=True)
+
+    # print("nuXmv has terminated!")
+    return _clean_output(output)
+
+
+async def _launch_nuxmv_async(
+    model_path: Path, timeout: float | None = None
+) -> List[str]:
+    if shutil.which("nuXmv") is None:
+        """The docker fallback has no asyncio API"""
+        return await asyncio.to_thread(_launch_nuxmv, model_path, timeout)
+    lines: list[str] = []
+    errors: list[str] = []
+    try:
+        async with _get_semaphore():
+            command = limited_command(["nuXmv", str(model_path)], settings.memory_limit)
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+
+            stdout, stderr = process.stdout, process.stderr
+            if stdout is None or stderr is None:
+                raise Exception("nuXmv pipes are not open")
+
+            async def read_lines() -> None:
+                async for line in stdout:
+                    lines.append(line.decode("UTF-8").rstrip("\n"))
+
+            async def read_errors() -> None:
+                """Drained with stdout, a full pipe would block nuXmv"""
+                errors.append((await stderr.read()).decode("UTF-8", errors="replace"))
+
+            async def communicate() -> int:
+                await asyncio.gather(read_lines(), read_errors())
+                return await process.wait()
+
+            try:
+                returncode = await asyncio.wait_for(communicate(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise ResourceLimitExceeded(lines)
+    finally:
+        model_path.unlink(missing_ok=True)
+    if limit_exceeded(returncode, "".join(errors)):
+        raise ResourceLimitExceeded(lines)
+    return _clean_output(lines)
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """One semaphore per event loop, asyncio primitives are bound to a
+    loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(settings.pool_size)
+    return _semaphores[loop]
+
+
+def _clean_output(output: List[str]) -> List[str]:
+    return [x for x in output if not (x[:3] == "***" or x[:7] == "WARNING" or x == "")]
+
+
+def _run_nuxmv(model_path: Path, timeout: float | None = None) -> List[str]:
+    """Runs a new nuXmv process on the model file."""
+    try:
+        """ "Trying nuXmv locally."""
+        process = subprocess.run(
+            limited_command(["nuXmv", str(model_path)], settings.memory_limit),
+            encoding="UTF-8",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        output = e.output if e.output is not None else ""
+        if isinstance(output, bytes):
+            output = output.decode("UTF-8", errors="replace")
+        raise ResourceLimitExceeded(output.splitlines())
+    except FileNotFoundError:
+        return _run_docker(model_path, timeout)
+    if process.returncode != 0:
+        if limit_exceeded(process.returncode, process.stderr):
+            raise ResourceLimitExceeded(process.stdout.splitlines())
+        return _run_docker(model_path, timeout)
+    return process.stdout.splitlines()
+
+
+def _run_docker(model_path: Path, timeout: float | None = None) -> List[str]:
+    """ "Runs nuXmv in a new docker container."""
+    command = f"nuXmv /home/{model_path.name}"
+    if timeout is not None:
+        command = f"timeout {timeout} {command}"
+    client = docker.from_env()
+    try:
+        output = str(
+            client.containers.run(
+                image=settings.docker_image,
+                volumes={f"{folder_path}": {"bind": "/home/", "mode": "rw"}},
+                command=command,
+                mem_limit=None
+                if settings.memory_limit is None
+                else f"{settings.memory_limit}m",
+                remove=True,
+            )
+        ).split("\\n")
+    except docker.errors.ContainerError as e:
+        stderr = e.stderr if e.stderr is not None else b""
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode("UTF-8", errors="replace")
+        if limit_exceeded(e.exit_status, stderr):
+            raise ResourceLimitExceeded()
+        raise e
+    return output
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class ResultCache:
+    """Exact cache of solver verdicts stored in a SQLite file.
+
+    The file is shared across runs and processes. When it grows over
+    'max_entries' the least recently used entries are evicted. The hits
+    are recorded in memory and written every 'touch_every' hits (and
+    before an eviction), so that lookups do not take the write lock.
+    """
+
+    evict_every = 1000
+    touch_every = 100
+
+    def __init__(self, path: Path, max_entries: int = 100000):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._n_insertions = 0
+        self._touched: dict[str, float] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+        self.evict()
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread, sqlite3 connections cannot be shared."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def make_key(check_type: str, expression: str, variables: list[str]) -> str:
+        variables_str = ";".join(sorted(set(variables)))
+        return f"{check_type}|{variables_str}|{expression}"
+
+    def get(self, key: str) -> bool | None:
+        connection = self._connection
+        row = connection.execute(
+            "SELECT value FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time()
+            flush = len(self._touched) >= self.touch_every
+        if flush:
+            self.flush()
+        return bool(row[0])
+
+    def flush(self) -> None:
+        """Writes the last use of the entries hit since the last flush, in
+        one transaction."""
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        if len(touched) == 0:
+            return
+        connection = self._connection
+        with connection:
+            connection.executemany(
+                "UPDATE results SET last_used = MAX(last_used, ?) WHERE key = ?",
+                [(last_used, key) for key, last_used in touched.items()],
+            )
+
+    def put(self, key: str, value: bool) -> None:
+        connection = self._connection
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)",
+                (key, int(value), time.time()),
+            )
+        with self._lock:
+            self._n_insertions += 1
+            evict = self._n_insertions % self.evict_every == 0
+        if evict:
+            self.evict()
+
+    def evict(self) -> None:
+        """Removes the least recently used entries above 'max_entries'."""
+        self.flush()
+        connection = self._connection
+        with connection:
+            connection.execute(
+                "DELETE FROM results WHERE key IN ("
+                "SELECT key FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        connection = self._connection
+        with connection:
+            connection.execute("DELETE FROM results")
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self._touched = {}
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __str__(self):
+        return (
+            f"{self.path}: {len(self)} entries, {self.hits} hits, "
+            f"{self.misses} misses"
+        )
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+import spot
+
+from crome_logic.tools.atomic_propositions import extract_ap
+
+COMMUTATIVE_OPERATORS = {"And", "Or", "Xor", "Equiv"}
+
+_simplifier = spot.tl_simplifier()
+
+
+def _shape(formula: spot.formula, shapes: dict[spot.formula, str]) -> str:
+    """Canonical string of the formula where every atom is printed as
+    'p'."""
+    if formula in shapes:
+        return shapes[formula]
+    if formula._is(spot.op_ap):
+        result = "p"
+    elif formula._is(spot.op_tt):
+        result = "1"
+    elif formula._is(spot.op_ff):
+        result = "0"
+    else:
+        children = [_shape(c, shapes) for c in formula]
+        if formula.kindstr() in COMMUTATIVE_OPERATORS:
+            children.sort()
+        result = f"{formula.kindstr()}({','.join(children)})"
+    shapes[formula] = result
+    return result
+
+
+def _print_sorted(
+    formula: spot.formula,
+    shapes: dict[spot.formula, str],
+    atoms: dict[str, str] | None,
+) -> str:
+    """Prints the formula with the operands of the commutative operators
+    sorted by shape.
+
+    If 'atoms' is not None, the atoms are renamed p0, p1, ... in order
+    of appearance and the renaming is stored in 'atoms'.
+    """
+    if formula._is(spot.op_ap):
+        name = str(formula)
+        if atoms is None:
+            return name
+        if name not in atoms:
+            atoms[name] = f"p{len(atoms)}"
+        return atoms[name]
+    if formula.size() == 0:
+        return shapes[formula]
+    children = list(formula)
+    if formula.kindstr() in COMMUTATIVE_OPERATORS:
+        children.sort(key=lambda c: (shapes[c], str(c)))
+    arguments = ",".join(_print_sorted(c, shapes, atoms) for c in children)
+    return f"{formula.kindstr()}({arguments})"
+
+
+def canonical_formula(
+    expression: str, rename_atoms: bool = False
+) -> tuple[str, dict[str, str]]:
+    """Returns a stable string for the expression, after simplifying it with
+    spot and sorting the operands of the commutative operators.
+
+    Returns the string and the renaming of the atoms (empty if
+    'rename_atoms' is False).
+    """
+    formula = _simplifier.simplify(spot.formula(expression))
+    shapes: dict[spot.formula, str] = {}
+    _shape(formula, shapes)
+    atoms: dict[str, str] | None = {} if rename_atoms else None
+    formula_str = _print_sorted(formula, shapes, atoms)
+    return formula_str, atoms if atoms is not None else {}
+
+
+def _used_variables(formula: spot.formula, variables: tuple[str, ...]) -> list[str]:
+    """Declarations (e.g. 'a: boolean') of the variables appearing in the atoms
+    of the formula.
+
+    The other variables are unconstrained and do not change the verdict.
+    """
+    atoms = set()
+    for atom in extract_ap(formula):
+        atoms.update(re.findall(r"[A-Za-z_][\w.\[\]]*", atom))
+    return [v for v in set(variables) if v.partition(":")[0].strip() in atoms]
+
+
+@lru_cache(maxsize=10000)
+def canonical_key(
+    expression: str, variables: tuple[str, ...], rename_atoms: bool = False
+) -> tuple[str, tuple[str, ...]]:
+    """Returns the canonical expression and variable declarations (nuXmv
+    syntax, e.g. 'a: boolean') to be used as a cache key."""
+    formula = spot.formula(expression)
+    used_variables = _used_variables(formula, variables)
+    if rename_atoms:
+        """Only atoms that are plain variables (not e.g. 'x > 3') can be renamed"""
+        names = {v.partition(":")[0].strip() for v in used_variables}
+        rename_atoms = extract_ap(formula) <= names
+    formula_str, atoms = canonical_formula(expression, rename_atoms)
+    if not rename_atoms:
+        return formula_str, tuple(sorted(used_variables))
+    declarations = set()
+    for variable in used_variables:
+        name, _, var_type = variable.partition(":")
+        declarations.add(f"{atoms.get(name.strip(), name.strip())}:{var_type}")
+    return formula_str, tuple(sorted(declarations))
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import socket
+import threading
+from typing import Any
+
+import docker
+
+from crome_logic.tools.nuxmv.limits import ResourceLimitExceeded, limit_exceeded
+
+
+class NuxmvContainer:
+    """A docker container kept alive for the whole process, each check runs
+    nuXmv in it via exec with the model streamed over stdin."""
+
+    script = (
+        "f=/tmp/crome_$$.smv && cat > $f && {limits}{nuxmv} $f; r=$?; rm -f $f; exit $r"
+    )
+
+    def __init__(self, image: str):
+        self.image = image
+        self._client: Any = None
+        self._container: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        if self._container is None:
+            return False
+        try:
+            self._container.reload()
+        except docker.errors.NotFound:
+            return False
+        return self._container.status == "running"
+
+    def start(self) -> None:
+        with self._lock:
+            if self.is_running:
+                return
+            self._client = docker.from_env()
+            self._container = self._client.containers.run(
+                image=self.image,
+                entrypoint=["tail", "-f", "/dev/null"],
+                detach=True,
+                remove=True,
+            )
+
+    def check(
+        self,
+        model: str,
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+    ) -> list[str]:
+        """Runs nuXmv on the model, returns its output.
+
+        Raises ResourceLimitExceeded if nuXmv exceeds 'timeout' seconds
+        or 'memory_limit' MB.
+        """
+        if self._container is None:
+            self.start()
+        try:
+            return self._exec(model, timeout, memory_limit)
+        except docker.errors.APIError:
+            """The state of the container is asked to docker only when an
+            exec fails, e.g. the container was stopped from outside"""
+            if self.is_running:
+                raise
+            self.start()
+            return self._exec(model, timeout, memory_limit)
+
+    def _exec(
+        self, model: str, timeout: float | None, memory_limit: int | None
+    ) -> list[str]:
+        client, container = self._client, self._container
+        if client is None or container is None:
+            raise Exception("The nuXmv container is not running")
+        command = ["sh", "-c", self._script(timeout, memory_limit)]
+        exec_id = client.api.exec_create(
+            container.id, command, stdin=True, stdout=True, stderr=True
+        )["Id"]
+        connection = client.api.exec_start(exec_id, socket=True)
+        raw_socket = getattr(connection, "_sock", connection)
+        try:
+            raw_socket.sendall(model.encode("UTF-8"))
+            raw_socket.shutdown(socket.SHUT_WR)
+            data = b""
+            while True:
+                chunk = raw_socket.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+        finally:
+            connection.close()
+        stdout, stderr = _demultiplex(data)
+        output = stdout.decode("UTF-8").splitlines()
+        exit_code = client.api.exec_inspect(exec_id)["ExitCode"]
+        if limit_exceeded(exit_code, stderr.decode("UTF-8", errors="replace")):
+            raise ResourceLimitExceeded(output)
+        return output
+
+    def _script(self, timeout: float | None, memory_limit: int | None) -> str:
+        limits = ""
+        if memory_limit is not None:
+            limits = f"ulimit -v {memory_limit * 1024} && "
+        nuxmv = "nuXmv"
+        if timeout is not None:
+            nuxmv = f"timeout -s KILL {timeout} nuXmv"
+        return self.script.format(limits=limits, nuxmv=nuxmv)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._container is not None:
+                try:
+                    self._container.stop(timeout=1)
+                except docker.errors.APIError:
+                    pass
+                self._container = None
+
+
+def _demultiplex(data: bytes) -> tuple[bytes, bytes]:
+    """Splits a docker attach stream into stdout and stderr.
+
+    Each frame has an 8 bytes header: stream id, 3 zero bytes and the
+    payload size (big endian).
+    """
+    streams = {1: b"", 2: b""}
+    i = 0
+    while i + 8 <= len(data):
+        stream = data[i]
+        size = int.from_bytes(data[i + 4 : i + 8], "big")
+        if stream in streams:
+            streams[stream] += data[i + 8 : i + 8 + size]
+        i += 8 + size
+    return streams[1], streams[2]
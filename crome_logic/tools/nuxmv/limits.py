@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+import signal
+
+
+class ResourceLimitExceeded(Exception):
+    """nuXmv ran out of time or memory, 'output' holds the lines it printed
+    before being stopped."""
+
+    def __init__(self, output: list[str] | None = None):
+        super().__init__("nuXmv exceeded its time or memory limit")
+        self.output = output if output is not None else []
+
+
+def limited_command(command: list[str], memory_limit: int | None) -> list[str]:
+    """Wraps 'command' in a shell limiting its address space to
+    'memory_limit' MB with ulimit (POSIX only).
+
+    The shell sets the limit and execs the command: a preexec_fn is not
+    safe while the pool readers and other threads are running.
+    """
+    if memory_limit is None:
+        return command
+    limit = f'ulimit -v {memory_limit * 1024} && exec "$@"'
+    return ["sh", "-c", limit, "sh"] + command
+
+
+def set_memory_limit(memory_limit: int | None) -> None:
+    """Limits the address space of the current process to 'memory_limit'
+    MB (POSIX only), for the worker processes running Python code."""
+    if memory_limit is None:
+        return
+    import resource
+
+    limit_bytes = memory_limit * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+
+
+"""Messages of a failed allocation under RLIMIT_AS"""
+_OUT_OF_MEMORY = re.compile(
+    r"out of memory|cannot allocate|bad_alloc|memory exhausted", re.IGNORECASE
+)
+
+_LIMIT_SIGNALS = (signal.SIGKILL, signal.SIGXCPU)
+
+
+def limit_exceeded(returncode: int, stderr: str = "") -> bool:
+    """True if nuXmv stopped because of a time or memory limit: killed by
+    SIGKILL or SIGXCPU (negative return code, or 128 + signal through a
+    shell), stopped by 'timeout' (124) or out of memory according to its
+    error messages. Other failures (e.g. syntax errors) are not limits."""
+    if returncode == 0:
+        return False
+    if returncode == 124:
+        return True
+    for sig in _LIMIT_SIGNALS:
+        if returncode in (-sig, 128 + sig):
+            return True
+    return _OUT_OF_MEMORY.search(stderr) is not None
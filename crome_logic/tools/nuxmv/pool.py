@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from crome_logic.tools.nuxmv.limits import (
+    ResourceLimitExceeded,
+    limit_exceeded,
+    limited_command,
+)
+
+
+class NuxmvWorker:
+    """A long-lived nuXmv process driven in interactive mode (-int)."""
+
+    prompt = "nuXmv > "
+    end_marker = "__crome_logic_end__"
+
+    def __init__(self, memory_limit: int | None = None):
+        self.memory_limit = memory_limit
+        command = ["nuXmv", "-int"]
+        if shutil.which("stdbuf") is not None:
+            """nuXmv does not flush stdout when it is a pipe."""
+            command = ["stdbuf", "-oL"] + command
+        self._process = subprocess.Popen(
+            limited_command(command, memory_limit),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="UTF-8",
+            bufsize=1,
+        )
+        """Lines are read by a thread so that they can be waited with a
+        timeout, None marks the end of the output"""
+        self._lines: queue.Queue[str | None] = queue.Queue()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+        """Last error messages, they tell if the process ran out of memory"""
+        self._errors: deque[str] = deque(maxlen=20)
+        self._error_reader = threading.Thread(target=self._read_errors, daemon=True)
+        self._error_reader.start()
+
+    def _read(self) -> None:
+        stdout = self._process.stdout
+        if stdout is not None:
+            for line in stdout:
+                self._lines.put(line)
+        self._lines.put(None)
+
+    def _read_errors(self) -> None:
+        stderr = self._process.stderr
+        if stderr is not None:
+            for line in stderr:
+                self._errors.append(line)
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process.poll() is None
+
+    def check(self, model_path: Path | str, timeout: float | None = None) -> list[str]:
+        """Loads the model and checks all its LTLSPEC, returns nuXmv output.
+
+        Raises ResourceLimitExceeded if it takes more than 'timeout'
+        seconds or the process runs out of memory.
+        """
+        commands = (
+            "reset\n"
+            f"read_model -i {model_path}\n"
+            "go\n"
+            "check_ltlspec\n"
+            f"echo {self.end_marker}\n"
+        )
+        stdin = self._process.stdin
+        if stdin is None:
+            raise Exception("nuXmv worker has no stdin")
+        stdin.write(commands)
+        stdin.flush()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        output: list[str] = []
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0, deadline - time.monotonic())
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                self.kill()
+                raise ResourceLimitExceeded(output)
+            if line is None:
+                returncode = self._process.wait()
+                self._error_reader.join(timeout=1)
+                if limit_exceeded(returncode, "".join(self._errors)):
+                    raise ResourceLimitExceeded(output)
+                raise Exception("nuXmv worker terminated unexpectedly")
+            """The prompt is not followed by a newline, strip it"""
+            line = line.replace(self.prompt, "").rstrip("\n")
+            if line.strip() == self.end_marker:
+                return output
+            output.append(line)
+
+    def kill(self) -> None:
+        if self.is_alive:
+            self._process.kill()
+            self._process.wait()
+
+    def close(self) -> None:
+        stdin = self._process.stdin
+        if self.is_alive:
+            try:
+                if stdin is None:
+                    raise Exception("nuXmv worker has no stdin")
+                stdin.write("quit\n")
+                stdin.flush()
+                self._process.wait(timeout=1)
+            except Exception:
+                self.kill()
+
+
+class NuxmvPool:
+    """Pool of at most 'size' interactive nuXmv workers, spawned on demand."""
+
+    def __init__(self, size: int = 1, memory_limit: int | None = None):
+        if size < 1:
+            raise ValueError("The pool needs at least one worker")
+        self.size = size
+        self.memory_limit = memory_limit
+        self._idle: queue.Queue[NuxmvWorker] = queue.Queue()
+        self._workers: list[NuxmvWorker] = []
+        self._lock = threading.Lock()
+        self._retired = False
+
+    def check(self, model_path: Path | str, timeout: float | None = None) -> list[str]:
+        worker = self._acquire()
+        try:
+            output = worker.check(model_path, timeout)
+        except Exception:
+            """A worker that timed out or failed is not reused"""
+            self._discard(worker)
+            raise
+        self._release(worker)
+        return output
+
+    def _release(self, worker: NuxmvWorker) -> None:
+        with self._lock:
+            if not self._retired:
+                self._idle.put(worker)
+                return
+        self._discard(worker)
+
+    def _acquire(self) -> NuxmvWorker:
+        wait = 0.0
+        while True:
+            try:
+                return self._idle.get(block=wait > 0, timeout=wait)
+            except queue.Empty:
+                pass
+            """Spawn a worker if there is room (e.g. after one was discarded)"""
+            with self._lock:
+                if len(self._workers) < self.size:
+                    worker = NuxmvWorker(memory_limit=self.memory_limit)
+                    self._workers.append(worker)
+                    return worker
+            wait = 0.1
+
+    def _discard(self, worker: NuxmvWorker) -> None:
+        worker.close()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+
+    def retire(self) -> None:
+        """Closes the idle workers, the busy ones are closed when their
+        check ends: checks already started complete normally."""
+        with self._lock:
+            self._retired = True
+            idle = []
+            while not self._idle.empty():
+                idle.append(self._idle.get_nowait())
+        for worker in idle:
+            self._discard(worker)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for worker in self._workers:
+                worker.close()
+            self._workers = []
+            self._idle = queue.Queue()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+
+@dataclass(frozen=True)
+class Trace:
+    """Execution printed by nuXmv for a violated LTLSPEC.
+
+    The values are stored row by row in a flat tuple: the value of
+    variables[j] in state i is array[i * len(variables) + j]. Booleans
+    and integers are converted, other values (e.g. enumeratives) are
+    kept as strings. If 'loop_start' is not None the trace is a lasso
+    and the states from 'loop_start' on repeat forever.
+    """
+
+    variables: tuple[str, ...]
+    array: tuple[Any, ...]
+    loop_start: int | None = None
+
+    def __len__(self) -> int:
+        if len(self.variables) == 0:
+            return 0
+        return len(self.array) // len(self.variables)
+
+    @property
+    def is_lasso(self) -> bool:
+        return self.loop_start is not None
+
+    def value(self, state: int, variable: str) -> Any:
+        return self.array[state * len(self.variables) + self.variables.index(variable)]
+
+    def state(self, state: int) -> dict[str, Any]:
+        n = len(self.variables)
+        return dict(zip(self.variables, self.array[state * n : (state + 1) * n]))
+
+    @property
+    def states(self) -> list[dict[str, Any]]:
+        return [self.state(i) for i in range(len(self))]
+
+    def __str__(self):
+        ret = ""
+        for i in range(len(self)):
+            if i == self.loop_start:
+                ret += "-- loop starts here\n"
+            values = ", ".join(f"{k}={v}" for k, v in self.state(i).items())
+            ret += f"{i}:\t{values}\n"
+        return ret[:-1]
+
+
+def parse_trace(lines: Iterable[str]) -> Trace | None:
+    """Builds a Trace from the lines nuXmv prints after '-- specification
+    ... is false'.
+
+    nuXmv only prints the variables that changed, each state inherits
+    the other values from the previous one. Returns None if there is no
+    state in the lines.
+    """
+    variables: dict[str, int] = {}
+    rows: list[dict[str, Any]] = []
+    loop_start = None
+    in_state = False
+    for line in lines:
+        line = line.strip()
+        if line.startswith("-> State:"):
+            rows.append(dict(rows[-1]) if len(rows) > 0 else {})
+            in_state = True
+        elif line.startswith("-> Input:"):
+            """Inputs are not part of the states"""
+            in_state = False
+        elif line.startswith("-- Loop starts here"):
+            loop_start = len(rows)
+        elif in_state and " = " in line:
+            name, _, value = line.partition(" = ")
+            if name not in variables:
+                variables[name] = len(variables)
+            rows[-1][name] = _convert(value)
+    if len(rows) == 0:
+        return None
+    names = tuple(variables)
+    array = tuple(row.get(name) for row in rows for name in names)
+    return Trace(variables=names, array=array, loop_start=loop_start)
+
+
+def _convert(value: str) -> Any:
+    if value == "TRUE":
+        return True
+    if value == "FALSE":
+        return False
+    try:
+        return int(value)
+    except ValueError:
+        return value
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Iterable
+
+
+class Verdict(IntEnum):
+    """Three-valued result of a check.
+
+    UNKNOWN is returned when the solver ran out of time or memory. TRUE
+    and FALSE compare equal to True and False, UNKNOWN is falsy: in a
+    boolean context it counts as 'not proved'. The operators &, | and ~
+    follow Kleene's three-valued logic.
+    """
+
+    FALSE = 0
+    TRUE = 1
+    UNKNOWN = -1
+
+    def __bool__(self):
+        return self is Verdict.TRUE
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def of(cls, value: int) -> Verdict:
+        """'value' is a Verdict or a bool (both are ints)."""
+        if isinstance(value, Verdict):
+            return value
+        return cls.TRUE if value else cls.FALSE
+
+    @property
+    def is_known(self) -> bool:
+        return self is not Verdict.UNKNOWN
+
+    def __and__(self, other: int) -> Verdict:
+        other = Verdict.of(other)
+        if self is Verdict.FALSE or other is Verdict.FALSE:
+            return Verdict.FALSE
+        if self is Verdict.UNKNOWN or other is Verdict.UNKNOWN:
+            return Verdict.UNKNOWN
+        return Verdict.TRUE
+
+    __rand__ = __and__
+
+    def __or__(self, other: int) -> Verdict:
+        other = Verdict.of(other)
+        if self is Verdict.TRUE or other is Verdict.TRUE:
+            return Verdict.TRUE
+        if self is Verdict.UNKNOWN or other is Verdict.UNKNOWN:
+            return Verdict.UNKNOWN
+        return Verdict.FALSE
+
+    __ror__ = __or__
+
+    def __invert__(self) -> Verdict:
+        if self is Verdict.UNKNOWN:
+            return Verdict.UNKNOWN
+        return Verdict.FALSE if self is Verdict.TRUE else Verdict.TRUE
+
+    @classmethod
+    def all(cls, verdicts: Iterable[bool | Verdict]) -> Verdict:
+        result = cls.TRUE
+        for verdict in verdicts:
+            result = result & verdict
+            if result is cls.FALSE:
+                return result
+        return result
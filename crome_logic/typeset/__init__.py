@@ -3,6 +3,8 @@ from __future__ import annotations
 from copy import copy, deepcopy
 from typing import Iterable
 
+import spot
+
 from crome_logic.tools.atomic_propositions import extract_ap
 from crome_logic.typelement import AnyCromeType, CromeType, TypeKind
 from crome_logic.typelement.basic import (
@@ -65,13 +67,17 @@ class Typeset(dict[str, AnyCromeType]):
 
     @classmethod
     def from_typesets(cls, typesets: Iterable[Typeset]) -> Typeset:
-
-        typeset = cls()
-
+        """Merges the typesets in one pass, the relationships among the
+        types are computed once."""
+        elements: dict[str, AnyCromeType] = {}
         for t in typesets:
-            typeset += t
+            for key, value in t.items():
+                if key in elements:
+                    _check_same_type(key, value, elements[key])
+                else:
+                    elements[key] = value
 
-        return typeset
+        return cls(set(elements.values()))
 
     def __setitem__(self, name, elem):
         self._add_elements({elem})
@@ -87,6 +93,11 @@ class Typeset(dict[str, AnyCromeType]):
             result[k] = v
         return result
 
+    def __reduce__(self):
+        """Pickled as its elements, the relationships are recomputed on
+        load."""
+        return self.__class__, (set(self.values()),)
+
     def __str__(self):
         ret = ""
         for (key, elem) in self.items():
@@ -126,21 +137,27 @@ class Typeset(dict[str, AnyCromeType]):
         """Updates self with self += element."""
         if isinstance(element, Boolean):
             element = Typeset({element})
+        new_elements = set()
         for key, value in element.items():
             if key in self:
-                if type(value).__name__ != type(self[key]).__name__:
-                    print(
-                        f"Trying to add an element with key '{key}' and value of typelement '{type(value).__name__}'"
-                    )
-                    print(
-                        f"ERROR:\n"
-                        f"There is already en element with key '{key}' and value of typelement '{type(self[key]).__name__}'"
-                    )
-                    raise Exception("Type Mismatch")
-            if key not in self:
-                self._add_elements({value})
+                _check_same_type(key, value, self[key])
+            else:
+                new_elements.add(value)
+        """The relationships are updated once for all the new elements"""
+        if len(new_elements) > 0:
+            self._add_elements(new_elements)
         return self
 
+    @property
+    def key(self) -> frozenset[tuple]:
+        """Identifies the types with the attributes the relationships
+        (refinement, mutex and adjacency) and the rules are derived from.
+
+        CromeType equality only compares the name and the class, two
+        typesets with equal types can still have different rules.
+        """
+        return frozenset(_element_key(element) for element in self.values())
+
     @property
     def size(self) -> int:
         return len(list(self.keys()))
@@ -154,7 +171,7 @@ class Typeset(dict[str, AnyCromeType]):
                 tuple_vars.append(f"{k}: {v.min}..{v.max}")
         return tuple_vars
 
-    def get_sub_typeset(self, formula: str):
+    def get_sub_typeset(self, formula: str | spot.formula):
         set_ap_str = extract_ap(formula)
         set_of_types = set(filter((lambda x: x.name in set_ap_str), self.values()))
         return Typeset(set_of_types)
@@ -292,3 +309,31 @@ class Typeset(dict[str, AnyCromeType]):
             elif v.kind == TypeKind.ACTION:
                 return "action"
         return "other"
+
+
+def _check_same_type(key: str, value: AnyCromeType, existing: AnyCromeType):
+    if type(value).__name__ != type(existing).__name__:
+        print(
+            f"Trying to add an element with key '{key}' and value of typelement '{type(value).__name__}'"
+        )
+        print(
+            f"ERROR:\n"
+            f"There is already en element with key '{key}' and value of typelement '{type(existing).__name__}'"
+        )
+        raise Exception("Type Mismatch")
+
+
+def _element_key(element: AnyCromeType) -> tuple:
+    refinement_of = frozenset(
+        t if isinstance(t, str) else t.name for t in element.refinement_of
+    )
+    return (
+        type(element).__name__,
+        element.name,
+        element.kind,
+        refinement_of,
+        getattr(element, "mutex_group", None),
+        frozenset(getattr(element, "adjacency_set", ())),
+        getattr(element, "min", None),
+        getattr(element, "max", None),
+    )
@@ -0,0 +1,63 @@
+"""LTL objects are interned only if their rules are the same."""
+
+import pytest
+
+pytest.importorskip("spot")
+
+from crome_logic.specification import temporal  # noqa: E402
+from crome_logic.specification.temporal import LTL  # noqa: E402
+from crome_logic.tools.verdict import Verdict  # noqa: E402
+from crome_logic.typelement.robotic import BooleanLocation  # noqa: E402
+from crome_logic.typeset import Typeset  # noqa: E402
+
+
+def locations(mutex_group: str = "") -> Typeset:
+    return Typeset(
+        {
+            BooleanLocation(name="l1", mutex_group=mutex_group),
+            BooleanLocation(name="l2", mutex_group=mutex_group),
+        }
+    )
+
+
+def test_same_types_are_shared() -> None:
+    spec = LTL("G(l1 & l2)", _typeset=locations("locations"))
+    assert LTL("G(l1 & l2)", _typeset=locations("locations")) is spec
+
+
+def test_mutex_group_is_part_of_the_key() -> None:
+    ts_mutex = locations("locations")
+    ts_plain = locations()
+    spec_mutex = LTL("G(l1 & l2)", _typeset=ts_mutex)
+    spec_plain = LTL("G(l1 & l2)", _typeset=ts_plain)
+    assert spec_mutex is not spec_plain
+    assert spec_mutex.key != spec_plain.key
+    assert spec_plain.typeset is ts_plain
+    assert not spec_mutex.mutex_rules.is_true_expression
+    assert spec_plain.mutex_rules.is_true_expression
+
+
+def test_refinement_memo_depends_on_the_rules(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    batches = []
+
+    def check_batch(checks, aps):
+        """Stub of the solver: every check holds."""
+        batches.append(checks)
+        return [Verdict.TRUE] * len(checks)
+
+    monkeypatch.setattr(temporal, "check_batch", check_batch)
+    spec = LTL("G(l1 & l2)", _typeset=locations("locations"))
+    other_mutex = LTL("F(l1)", _typeset=locations("locations"))
+    other_plain = LTL("F(l1)", _typeset=locations())
+
+    assert (spec <= other_mutex) is Verdict.TRUE
+    n_batches = len(batches)
+    assert n_batches > 0
+    assert (spec <= other_mutex) is Verdict.TRUE
+    assert len(batches) == n_batches
+
+    """Same formula, other rules: the memo of other_mutex is not reused"""
+    assert (spec <= other_plain) is Verdict.TRUE
+    assert len(batches) > n_batches
@@ -0,0 +1,31 @@
+"""Refinement lattice with a specification whose satisfiability is
+unknown."""
+
+import pytest
+
+pytest.importorskip("spot")
+
+from crome_logic.specification.temporal import LTL  # noqa: E402
+from crome_logic.specification.temporal.lattice import (  # noqa: E402
+    build_refinement_lattice,
+)
+from crome_logic.tools.verdict import Verdict  # noqa: E402
+
+
+def test_unknown_satisfiability_is_not_a_refinement(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    unknown = LTL("G(a)")
+    true = LTL("TRUE")
+
+    def check_satisfiability(self: LTL, checker: object = None) -> Verdict:
+        """Stub: the check of 'unknown' ran out of time."""
+        if self is unknown:
+            return Verdict.UNKNOWN
+        return Verdict.TRUE
+
+    monkeypatch.setattr(LTL, "check_satisfiability", check_satisfiability)
+    lattice = build_refinement_lattice([unknown, true])
+    assert lattice.refines == [set(), set()]
+    assert lattice.unknown == {(0, 1), (1, 0)}
+    assert lattice.n_checked == 0
@@ -0,0 +1,61 @@
+"""Model counts of the truth table and BDD branches of Bool.model_count
+against brute-force enumeration."""
+
+from itertools import product
+
+import pytest
+
+pyeda_expr = pytest.importorskip("pyeda.boolalg.expr")
+expr2bdd = pytest.importorskip("pyeda.boolalg.bdd").expr2bdd
+
+FORMULAS = [
+    ("a | b", 3),
+    ("a & b", 1),
+    ("a ^ b", 2),
+    ("(a | ~b) & (b | ~a)", 2),
+    ("a & ~a", 0),
+    ("(a & b) | c", 5),
+    ("a | (b & c & d)", 9),
+    ("(a => b) & (c | d) & ~(e & a)", 15),
+]
+
+
+@pytest.fixture
+def boolean():
+    """The boolean package is imported with crome_logic.specification,
+    which needs spot."""
+    return pytest.importorskip("crome_logic.specification.boolean")
+
+
+def brute_force(expression) -> int:
+    support = sorted(expression.support, key=str)
+    return sum(
+        expression.restrict(dict(zip(support, values))).is_one()
+        for values in product([0, 1], repeat=len(support))
+    )
+
+
+@pytest.mark.parametrize("formula,expected", FORMULAS)
+def test_brute_force(formula: str, expected: int) -> None:
+    assert brute_force(pyeda_expr.expr(formula)) == expected
+
+
+@pytest.mark.parametrize("formula,expected", FORMULAS)
+def test_model_count(boolean, formula: str, expected: int) -> None:
+    expression = pyeda_expr.expr(formula)
+    n_variables = len(expression.support)
+    assert boolean.truth_table(expression).model_count == expected
+    assert boolean.bdd_model_count(expr2bdd(expression), n_variables) == expected
+
+
+def test_bdd_model_count_extra_variables(boolean) -> None:
+    bdd = expr2bdd(pyeda_expr.expr("a | b"))
+    assert boolean.bdd_model_count(bdd) == 3
+    assert boolean.bdd_model_count(bdd, 4) == 12
+
+
+def test_bdd_model_count_independent_clauses(boolean) -> None:
+    x = [pyeda_expr.exprvar("x", i) for i in range(10)]
+    y = [pyeda_expr.exprvar("y", i) for i in range(10)]
+    expression = pyeda_expr.And(*(x[i] | y[i] for i in range(10)))
+    assert boolean.bdd_model_count(expr2bdd(expression)) == 3**10
@@ -0,0 +1,58 @@
+"""Concurrent nuXmv checks against the same checks run one at a time."""
+
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("spot")
+if shutil.which("nuXmv") is None:
+    pytest.skip("nuXmv is not on the PATH", allow_module_level=True)
+
+from crome_logic.specification.temporal import LTL  # noqa: E402
+from crome_logic.tools import nuxmv  # noqa: E402
+
+N_FORMULAS = 50
+N_THREADS = 8
+
+
+@pytest.fixture
+def nuxmv_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every check has to reach nuXmv: the persistent cache is off. The
+    pool is rebuilt with the original size once the settings are
+    restored."""
+    monkeypatch.setattr(nuxmv.settings, "use_cache", False)
+    monkeypatch.setattr(nuxmv.settings, "pool_size", N_THREADS)
+
+
+def test_parallel_checks(nuxmv_settings: None) -> None:
+    formulas = []
+    for i in range(N_FORMULAS):
+        formulas.append(LTL(f"G(a{i} -> F(b{i})) & F(a{i})"))
+        formulas.append(LTL(f"G(a{i}) & F(!a{i})"))
+        formulas.append(LTL(f"G(a{i} | !a{i})"))
+
+    """The checker is explicit: spot and the verdicts memoized on the LTL
+    objects are skipped. The propositional fast path still runs first,
+    every formula has a temporal operator so none of them takes it"""
+    with ThreadPoolExecutor(max_workers=N_THREADS) as executor:
+        parallel_sat = list(
+            executor.map(lambda f: f.check_satisfiability(checker="nuxmv"), formulas)
+        )
+        parallel_val = list(
+            executor.map(lambda f: f.check_validity(checker="nuxmv"), formulas)
+        )
+
+    """Baseline: the same formulas sent to nuXmv one at a time, without the
+    LTL objects"""
+    sequential_sat = []
+    sequential_val = []
+    for f in formulas:
+        sat_f = f & f.adjacency_and_mutex_rules
+        sequential_sat.append(
+            nuxmv.check_satisfiability(str(sat_f), sat_f.typeset.to_str_nuxmv())
+        )
+        sequential_val.append(nuxmv.check_validity(str(f), f.typeset.to_str_nuxmv()))
+
+    assert sequential_sat == parallel_sat
+    assert sequential_val == parallel_val
@@ -0,0 +1,21 @@
+"""Formulas whose NNF collapses to a constant, pyeda's tseitin() fails on
+them."""
+
+import pytest
+
+expr = pytest.importorskip("pyeda.boolalg.expr").expr
+"""The boolean package is imported with crome_logic.specification, which
+needs spot"""
+tseitin = pytest.importorskip("crome_logic.specification.boolean.tseitin")
+
+
+def test_nnf_false() -> None:
+    expression = expr("a & ~(b | a)")
+    assert not tseitin.is_satisfiable(expression)
+    assert not tseitin.is_valid(expression)
+
+
+def test_nnf_true() -> None:
+    expression = expr("a | ~(b & a)")
+    assert tseitin.is_satisfiable(expression)
+    assert tseitin.is_valid(expression)